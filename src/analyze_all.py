@@ -4,6 +4,7 @@ Orchestrates quality validation, velocity calculation, insights, and comparative
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
@@ -26,29 +27,34 @@ def run_full_analysis():
     logger.info("TECH ADOPTION ANALYSIS PIPELINE - STARTING")
     logger.info("="*70)
 
-    # Step 1: Data Quality Validation
-    try:
-        logger.info("\n" + "="*70)
-        logger.info("STEP 1: DATA QUALITY VALIDATION")
-        logger.info("="*70)
-        quality_results = validate_all_lists()
-        logger.info("✓ Quality validation completed")
-    except Exception as e:
-        logger.error(f"✗ Quality validation failed: {e}")
-        quality_results = None
-
-    # Step 2: Velocity Calculation
-    try:
-        logger.info("\n" + "="*70)
-        logger.info("STEP 2: VELOCITY CALCULATION")
-        logger.info("="*70)
-        velocity_results = calculate_all_velocities()
-        logger.info("✓ Velocity calculation completed")
-    except Exception as e:
-        logger.error(f"✗ Velocity calculation failed: {e}")
-        velocity_results = None
+    def _safe(step_name, fn):
+        """Run a pipeline step, returning None on failure"""
+        try:
+            logger.info("\n" + "="*70)
+            logger.info(f"{step_name}")
+            logger.info("="*70)
+            result = fn()
+            logger.info(f"✓ {step_name.split(': ', 1)[-1].title()} completed")
+            return result
+        except Exception as e:
+            logger.error(f"✗ {step_name.split(': ', 1)[-1].title()} failed: {e}")
+            return None
+
+    # Steps 1 & 2: quality validation and velocity calculation are
+    # independent (both read only raw data), so run them concurrently.
+    # Both are dominated by file I/O, which releases the GIL.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        quality_future = executor.submit(
+            _safe, "STEP 1: DATA QUALITY VALIDATION", validate_all_lists
+        )
+        velocity_future = executor.submit(
+            _safe, "STEP 2: VELOCITY CALCULATION", calculate_all_velocities
+        )
+        quality_results = quality_future.result()
+        velocity_results = velocity_future.result()
 
     # Step 3: Insight Generation
+    # (depends on the velocity files written in step 2, so runs after)
     try:
         logger.info("\n" + "="*70)
         logger.info("STEP 3: INSIGHT GENERATION")
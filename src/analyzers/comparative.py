@@ -4,18 +4,30 @@ Generates cross-list insights - the key differentiator
 Detects patterns between enterprise AI and fintech AI adoption
 """
 
-import json
+import itertools
+import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 from collections import defaultdict
-import statistics
+from statistics import fmean, median
+import time
 
 from ..utils.config import PROCESSED_DATA_DIR, ACTIVE_LISTS
+from ..utils.jsonio import load_json, dump_json, dumps_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# Log separator, built once at import instead of per log call
+_BAR = "=" * 70
+
+# Category groups for leading-indicator detection (infrastructure
+# adoption tends to precede application adoption)
+_INFRA_CATEGORIES = frozenset({'vector_db', 'ai_infrastructure', 'ml_platform'})
+_APP_CATEGORIES = frozenset({'ai_platform', 'fintech_infrastructure', 'trading_platform'})
+
 
 class ComparativeAnalyzer:
     """Analyzes patterns across multiple strategic lists"""
@@ -23,30 +35,55 @@ class ComparativeAnalyzer:
     def __init__(self):
         """Initialize comparative analyzer"""
         self.processed_dir = PROCESSED_DATA_DIR
+        # Memoized parsed files, keyed by (kind, list_name).
+        # Avoids re-globbing and re-parsing the same JSON when the same
+        # list participates in multiple comparisons in one run.
+        self._cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+        # Memoized strategic insights keyed by comparison content hash
+        self._insights_cache: Dict[int, List[str]] = {}
+
+    def _latest(self, prefix: str) -> Optional[Path]:
+        """
+        Find the newest processed file starting with prefix
 
-    def load_insights(self, list_name: str) -> Optional[Dict]:
-        """Load latest insights for a list"""
-        pattern = f"insights_{list_name}_*.json"
-        files = sorted(self.processed_dir.glob(pattern), reverse=True)
-
-        if not files:
-            logger.warning(f"No insights found for {list_name}")
+        Filenames embed a YYYYMMDD_HHMMSS timestamp, so lexicographic
+        comparison equals chronological order. A single os.scandir pass
+        avoids the per-entry stat calls and list sort of Path.glob.
+        """
+        best = None
+        with os.scandir(self.processed_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith('.json') and (best is None or name > best):
+                    best = name
+
+        return self.processed_dir / best if best else None
+
+    def _load(self, kind: str, list_name: str) -> Optional[Dict]:
+        """Load (and cache) the latest processed file of a kind for a list"""
+        cache_key = (kind, list_name)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        latest = self._latest(f"{kind}_{list_name}_")
+
+        if not latest:
+            logger.warning("No %s data found for %s", kind, list_name)
+            self._cache[cache_key] = None
             return None
 
-        with open(files[0], 'r') as f:
-            return json.load(f)
+        data = load_json(latest)
 
-    def load_velocity(self, list_name: str) -> Optional[Dict]:
-        """Load latest velocity data for a list"""
-        pattern = f"velocity_{list_name}_*.json"
-        files = sorted(self.processed_dir.glob(pattern), reverse=True)
+        self._cache[cache_key] = data
+        return data
 
-        if not files:
-            logger.warning(f"No velocity data found for {list_name}")
-            return None
+    def load_insights(self, list_name: str) -> Optional[Dict]:
+        """Load latest insights for a list"""
+        return self._load('insights', list_name)
 
-        with open(files[0], 'r') as f:
-            return json.load(f)
+    def load_velocity(self, list_name: str) -> Optional[Dict]:
+        """Load latest velocity data for a list"""
+        return self._load('velocity', list_name)
 
     def compare_adoption_velocity(self, list1_data: Dict, list2_data: Dict,
                                   list1_name: str, list2_name: str) -> Dict:
@@ -59,28 +96,24 @@ class ComparativeAnalyzer:
         list1_vel = list1_data.get('velocities', [])
         list2_vel = list2_data.get('velocities', [])
 
-        # Extract momentum scores
-        list1_momenta = []
-        list2_momenta = []
-
-        for tech in list1_vel:
-            github = tech.get('github', {})
-            if 'error' not in github and 'momentum_score' in github:
-                list1_momenta.append(github['momentum_score'])
-
-        for tech in list2_vel:
-            github = tech.get('github', {})
-            if 'error' not in github and 'momentum_score' in github:
-                list2_momenta.append(github['momentum_score'])
+        # Extract momentum scores in a single pass per list
+        list1_momenta = [
+            g['momentum_score'] for tech in list1_vel
+            if (g := tech.get('github')) and 'error' not in g and 'momentum_score' in g
+        ]
+        list2_momenta = [
+            g['momentum_score'] for tech in list2_vel
+            if (g := tech.get('github')) and 'error' not in g and 'momentum_score' in g
+        ]
 
         if not list1_momenta or not list2_momenta:
             return {'error': 'insufficient_data'}
 
         # Calculate statistics
-        list1_avg = statistics.mean(list1_momenta)
-        list2_avg = statistics.mean(list2_momenta)
-        list1_median = statistics.median(list1_momenta)
-        list2_median = statistics.median(list2_momenta)
+        list1_avg = fmean(list1_momenta)
+        list2_avg = fmean(list2_momenta)
+        list1_median = median(list1_momenta)
+        list2_median = median(list2_momenta)
 
         velocity_diff = list1_avg - list2_avg
         velocity_ratio = list1_avg / list2_avg if list2_avg != 0 else float('inf')
@@ -97,10 +130,18 @@ class ComparativeAnalyzer:
             interpretation = f"{list2_name} adoption is {abs(velocity_diff):.1f}% faster than {list1_name}"
 
         return {
-            f'{list1_name}_average_momentum': list1_avg,
-            f'{list2_name}_average_momentum': list2_avg,
-            f'{list1_name}_median_momentum': list1_median,
-            f'{list2_name}_median_momentum': list2_median,
+            # Nested per-list stats avoid building dynamic
+            # '<list>_average_momentum' style keys here and in consumers
+            'per_list': {
+                list1_name: {
+                    'average_momentum': list1_avg,
+                    'median_momentum': list1_median,
+                },
+                list2_name: {
+                    'average_momentum': list2_avg,
+                    'median_momentum': list2_median,
+                },
+            },
             'velocity_difference_percentage': velocity_diff,
             'velocity_ratio': velocity_ratio,
             'leader': leader,
@@ -125,35 +166,42 @@ class ComparativeAnalyzer:
             'shared_categories': []
         }
 
-        all_categories = set(list1_categories.keys()) | set(list2_categories.keys())
-
-        for category in all_categories:
-            cat1 = list1_categories.get(category)
-            cat2 = list2_categories.get(category)
-
-            if cat1 and cat2:
-                # Shared category
-                patterns['shared_categories'].append(category)
-                patterns['category_comparison'].append({
-                    'category': category,
-                    f'{list1_name}_momentum': cat1['average_momentum'],
-                    f'{list2_name}_momentum': cat2['average_momentum'],
-                    'momentum_gap': cat1['average_momentum'] - cat2['average_momentum'],
-                    f'{list1_name}_count': cat1['technology_count'],
-                    f'{list2_name}_count': cat2['technology_count']
-                })
-            elif cat1:
-                patterns['unique_to_list1'].append({
-                    'category': category,
-                    'momentum': cat1['average_momentum'],
-                    'tech_count': cat1['technology_count']
-                })
-            elif cat2:
-                patterns['unique_to_list2'].append({
-                    'category': category,
-                    'momentum': cat2['average_momentum'],
-                    'tech_count': cat2['technology_count']
-                })
+        # Partition categories with set operations instead of a
+        # three-branch if/elif per category with double .get lookups
+        shared = list1_categories.keys() & list2_categories.keys()
+        only1 = list1_categories.keys() - list2_categories.keys()
+        only2 = list2_categories.keys() - list1_categories.keys()
+
+        patterns['shared_categories'] = list(shared)
+
+        comparison_append = patterns['category_comparison'].append
+        for category in shared:
+            cat1 = list1_categories[category]
+            cat2 = list2_categories[category]
+            comparison_append({
+                'category': category,
+                f'{list1_name}_momentum': cat1['average_momentum'],
+                f'{list2_name}_momentum': cat2['average_momentum'],
+                'momentum_gap': cat1['average_momentum'] - cat2['average_momentum'],
+                f'{list1_name}_count': cat1['technology_count'],
+                f'{list2_name}_count': cat2['technology_count']
+            })
+        patterns['unique_to_list1'] = [
+            {
+                'category': category,
+                'momentum': list1_categories[category]['average_momentum'],
+                'tech_count': list1_categories[category]['technology_count']
+            }
+            for category in only1
+        ]
+        patterns['unique_to_list2'] = [
+            {
+                'category': category,
+                'momentum': list2_categories[category]['average_momentum'],
+                'tech_count': list2_categories[category]['technology_count']
+            }
+            for category in only2
+        ]
 
         return patterns
 
@@ -177,46 +225,50 @@ class ComparativeAnalyzer:
         list1_by_cat = defaultdict(list)
         list2_by_cat = defaultdict(list)
 
+        # Bind the github dict once per tech and store (tech, momentum)
+        # tuples - cheaper to build than per-entry dicts
         for tech in list1_vel:
-            github = tech.get('github', {})
-            if 'error' not in github and 'momentum_score' in github:
-                cat = tech.get('category', 'unknown')
-                list1_by_cat[cat].append({
-                    'tech': tech['technology'],
-                    'momentum': github['momentum_score']
-                })
+            github = tech.get('github')
+            if github is None or 'error' in github:
+                continue
+            momentum = github.get('momentum_score')
+            if momentum is None:
+                continue
+            list1_by_cat[tech.get('category', 'unknown')].append((tech['technology'], momentum))
 
         for tech in list2_vel:
-            github = tech.get('github', {})
-            if 'error' not in github and 'momentum_score' in github:
-                cat = tech.get('category', 'unknown')
-                list2_by_cat[cat].append({
-                    'tech': tech['technology'],
-                    'momentum': github['momentum_score']
-                })
-
-        # Look for infrastructure preceding applications
-        infra_categories = ['vector_db', 'ai_infrastructure', 'ml_platform']
-        app_categories = ['ai_platform', 'fintech_infrastructure', 'trading_platform']
-
-        for infra_cat in infra_categories:
-            if infra_cat in list1_by_cat:
-                infra_momentum = statistics.mean([t['momentum'] for t in list1_by_cat[infra_cat]])
-
-                # Check if high infrastructure adoption precedes application adoption
-                for app_cat in app_categories:
-                    if app_cat in list2_by_cat:
-                        app_momentum = statistics.mean([t['momentum'] for t in list2_by_cat[app_cat]])
-
-                        if infra_momentum > app_momentum + 20:  # Infrastructure significantly ahead
-                            indicators.append({
-                                'indicator_type': 'infrastructure_leads_application',
-                                'leading_category': infra_cat,
-                                'following_category': app_cat,
-                                'momentum_gap': infra_momentum - app_momentum,
-                                'hypothesis': f"{infra_cat} adoption in {list1_name} may predict {app_cat} growth in {list2_name}",
-                                'confidence': 'medium'  # Would need time-series data to confirm
-                            })
+            github = tech.get('github')
+            if github is None or 'error' in github:
+                continue
+            momentum = github.get('momentum_score')
+            if momentum is None:
+                continue
+            list2_by_cat[tech.get('category', 'unknown')].append((tech['technology'], momentum))
+
+        # Precompute each category mean once instead of recomputing the
+        # infrastructure mean inside the application loop; the frozenset
+        # intersection keeps only categories actually present
+        infra_means = {
+            cat: fmean(momentum for _, momentum in list1_by_cat[cat])
+            for cat in _INFRA_CATEGORIES & list1_by_cat.keys()
+        }
+        app_means = {
+            cat: fmean(momentum for _, momentum in list2_by_cat[cat])
+            for cat in _APP_CATEGORIES & list2_by_cat.keys()
+        }
+
+        # Check if high infrastructure adoption precedes application adoption
+        for infra_cat, infra_momentum in infra_means.items():
+            for app_cat, app_momentum in app_means.items():
+                if infra_momentum > app_momentum + 20:  # Infrastructure significantly ahead
+                    indicators.append({
+                        'indicator_type': 'infrastructure_leads_application',
+                        'leading_category': infra_cat,
+                        'following_category': app_cat,
+                        'momentum_gap': infra_momentum - app_momentum,
+                        'hypothesis': f"{infra_cat} adoption in {list1_name} may predict {app_cat} growth in {list2_name}",
+                        'confidence': 'medium'  # Would need time-series data to confirm
+                    })
 
         return indicators
 
@@ -237,8 +289,8 @@ class ComparativeAnalyzer:
         list2_emerging = len(list2_insights.get('emerging_technologies', []))
 
         # Average momentum as proxy for market maturity
-        list1_avg_momentum = statistics.mean([l['momentum_score'] for l in list1_leaders]) if list1_leaders else 0
-        list2_avg_momentum = statistics.mean([l['momentum_score'] for l in list2_leaders]) if list2_leaders else 0
+        list1_avg_momentum = fmean([l['momentum_score'] for l in list1_leaders]) if list1_leaders else 0
+        list2_avg_momentum = fmean([l['momentum_score'] for l in list2_leaders]) if list2_leaders else 0
 
         lag_analysis = {
             f'{list1_name}_maturity_score': list1_avg_momentum,
@@ -271,9 +323,28 @@ class ComparativeAnalyzer:
         """
         Generate strategic insight statements from comparative data
 
+        Pure with respect to its input, so results are memoized by a
+        content hash of the comparison - repeat pipeline runs on
+        unchanged data skip the string building entirely.
+
         Returns:
             List of insight strings
         """
+        cache_key = hash(dumps_json({
+            k: comparative_data.get(k)
+            for k in ('lists_compared', 'velocity_comparison',
+                      'category_patterns', 'leading_indicators', 'adoption_lag')
+        }))
+        cached = self._insights_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        insights = self._build_strategic_insights(comparative_data)
+        self._insights_cache[cache_key] = insights
+        return insights
+
+    def _build_strategic_insights(self, comparative_data: Dict) -> List[str]:
+        """Build the strategic insight statements (uncached)"""
         insights = []
 
         # Velocity comparison insight
@@ -321,17 +392,39 @@ class ComparativeAnalyzer:
         Returns:
             Comparative analysis report
         """
-        logger.info(f"\n{'='*70}")
-        logger.info(f"COMPARATIVE ANALYSIS: {list1_name.upper()} vs {list2_name.upper()}")
-        logger.info(f"{'='*70}")
+        names = (list1_name, list2_name)
+        return self.compare_lists_preloaded(
+            list1_name, list2_name,
+            {n: self.load_insights(n) for n in names},
+            {n: self.load_velocity(n) for n in names},
+        )
 
-        # Load data
-        list1_insights = self.load_insights(list1_name)
-        list2_insights = self.load_insights(list2_name)
-        list1_velocity = self.load_velocity(list1_name)
-        list2_velocity = self.load_velocity(list2_name)
+    def compare_lists_preloaded(self, list1_name: str, list2_name: str,
+                                insights_map: Dict, velocity_map: Dict) -> Dict:
+        """
+        Comprehensive comparison between two lists using preloaded data
 
-        if not all([list1_insights, list2_insights, list1_velocity, list2_velocity]):
+        Args:
+            list1_name: First list name
+            list2_name: Second list name
+            insights_map: Mapping of list name to loaded insights
+            velocity_map: Mapping of list name to loaded velocity data
+
+        Returns:
+            Comparative analysis report
+        """
+        logger.info("\n" + _BAR)
+        logger.info("COMPARATIVE ANALYSIS: %s vs %s", list1_name.upper(), list2_name.upper())
+        logger.info(_BAR)
+
+        list1_insights = insights_map.get(list1_name)
+        list2_insights = insights_map.get(list2_name)
+        list1_velocity = velocity_map.get(list1_name)
+        list2_velocity = velocity_map.get(list2_name)
+
+        # Chained and short-circuits on the first missing dataset
+        # without materializing a list
+        if not (list1_insights and list2_insights and list1_velocity and list2_velocity):
             logger.error("Missing data for comparative analysis")
             return {'error': 'insufficient_data'}
 
@@ -348,7 +441,7 @@ class ComparativeAnalyzer:
         )
         comparison['velocity_comparison'] = velocity_comp
         if 'interpretation' in velocity_comp:
-            logger.info(f"  {velocity_comp['interpretation']}")
+            logger.info("  %s", velocity_comp['interpretation'])
 
         # Category patterns
         logger.info("\nAnalyzing category patterns...")
@@ -356,9 +449,9 @@ class ComparativeAnalyzer:
             list1_insights, list2_insights, list1_name, list2_name
         )
         comparison['category_patterns'] = category_patterns
-        logger.info(f"  Shared categories: {len(category_patterns['shared_categories'])}")
-        logger.info(f"  Unique to {list1_name}: {len(category_patterns['unique_to_list1'])}")
-        logger.info(f"  Unique to {list2_name}: {len(category_patterns['unique_to_list2'])}")
+        logger.info("  Shared categories: %d", len(category_patterns['shared_categories']))
+        logger.info("  Unique to %s: %d", list1_name, len(category_patterns['unique_to_list1']))
+        logger.info("  Unique to %s: %d", list2_name, len(category_patterns['unique_to_list2']))
 
         # Leading indicators
         logger.info("\nIdentifying potential leading indicators...")
@@ -366,10 +459,10 @@ class ComparativeAnalyzer:
             list1_velocity, list2_velocity, list1_name, list2_name
         )
         comparison['leading_indicators'] = indicators
-        if indicators:
-            logger.info(f"  Found {len(indicators)} potential leading indicator patterns")
+        if indicators and logger.isEnabledFor(logging.INFO):
+            logger.info("  Found %d potential leading indicator patterns", len(indicators))
             for ind in indicators:
-                logger.info(f"    - {ind['hypothesis']}")
+                logger.info("    - %s", ind['hypothesis'])
 
         # Adoption lag
         logger.info("\nAnalyzing adoption lag patterns...")
@@ -377,18 +470,19 @@ class ComparativeAnalyzer:
             list1_insights, list2_insights, list1_name, list2_name
         )
         comparison['adoption_lag'] = lag_analysis
-        logger.info(f"  {lag_analysis['interpretation']}")
+        logger.info("  %s", lag_analysis['interpretation'])
 
         # Generate strategic insights
         logger.info("\nGenerating strategic insights...")
         strategic_insights = self.generate_strategic_insights(comparison)
         comparison['strategic_insights'] = strategic_insights
 
-        logger.info(f"\n{'='*70}")
+        logger.info("\n" + _BAR)
         logger.info("KEY STRATEGIC INSIGHTS")
-        logger.info(f"{'='*70}")
-        for i, insight in enumerate(strategic_insights, 1):
-            logger.info(f"{i}. {insight}")
+        logger.info(_BAR)
+        if logger.isEnabledFor(logging.INFO):
+            for i, insight in enumerate(strategic_insights, 1):
+                logger.info("%d. %s", i, insight)
 
         return comparison
 
@@ -398,7 +492,7 @@ def generate_comparative_analysis() -> Dict:
     Generate comparative analysis between all active lists
 
     Returns:
-        Complete comparative analysis report
+        Comparison reports keyed by '<list1>_vs_<list2>' pair name
     """
     analyzer = ComparativeAnalyzer()
 
@@ -409,16 +503,28 @@ def generate_comparative_analysis() -> Dict:
         logger.error("Need at least 2 lists for comparative analysis")
         return {'error': 'insufficient_lists'}
 
-    # Compare enterprise vs fintech
-    comparison = analyzer.compare_lists(list_names[0], list_names[1])
+    # Preload each list's data once so comparing all pairs costs
+    # O(N) file parses instead of O(N^2)
+    insights_map = {name: analyzer.load_insights(name) for name in list_names}
+    velocity_map = {name: analyzer.load_velocity(name) for name in list_names}
+
+    # Compare all list pairs (enterprise vs fintech with the current config)
+    comparisons = {}
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    for name1, name2 in itertools.combinations(list_names, 2):
+        comparison = analyzer.compare_lists_preloaded(
+            name1, name2, insights_map, velocity_map
+        )
 
-    # Save results
-    output_file = PROCESSED_DATA_DIR / f'comparative_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    with open(output_file, 'w') as f:
-        json.dump(comparison, f, indent=2)
-    logger.info(f"\nSaved comparative analysis to {output_file}")
+        # Save results; the pair names in the stem keep a third active
+        # list from overwriting earlier pairs within one run
+        output_file = PROCESSED_DATA_DIR / (
+            f'comparative_analysis_{name1}_vs_{name2}_{timestamp}.json')
+        dump_json(comparison, output_file)
+        logger.info("\nSaved comparative analysis to %s", output_file)
+        comparisons[f'{name1}_vs_{name2}'] = comparison
 
-    return comparison
+    return comparisons
 
 
 if __name__ == "__main__":
@@ -3,17 +3,43 @@ Insight Generator
 Detects patterns and generates strategic insights from quality and velocity data
 """
 
-import json
+import heapq
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict
 
+import numpy as np
+
 from ..utils.config import PROCESSED_DATA_DIR, TOP_N_INSIGHTS
+from ..utils.jsonio import dump_json, load_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# velocity_type → classification bucket; a single table lookup replaces
+# chained membership checks in the scan
+_BUCKET = {
+    'accelerating': 'emerging',
+    'new_emergence': 'emerging',
+    'declining': 'declining',
+    'collapsing': 'declining',
+}
+
+
+@lru_cache(maxsize=4)
+def _load_quality_file(path_str: str) -> Dict:
+    """Parse a quality validation file once per path
+
+    The filename embeds the run timestamp, so a fresh validation run
+    produces a new path and naturally misses the cache.
+    """
+    return load_json(path_str)
+
 
 class InsightGenerator:
     """Generates strategic insights from analyzed data"""
@@ -21,63 +47,147 @@ class InsightGenerator:
     def __init__(self):
         """Initialize insight generator"""
         self.processed_dir = PROCESSED_DATA_DIR
+        # Latest-file lookups per filename prefix, validated against the
+        # processed directory mtime so new analysis output invalidates
+        self._latest_file_cache: Dict[str, Tuple[int, Path]] = {}
+        # Last fused velocity scan: (velocity_data, n, results). Holding
+        # the data reference keeps the identity check valid, so the
+        # leaders/emerging/declining methods share one pass per report
+        self._scan_memo: Optional[Tuple[Dict, int, Tuple[List[Dict], List[Dict], List[Dict]]]] = None
+
+    def _latest_file(self, prefix: str) -> Optional[Path]:
+        """Find (and cache) the newest processed file with this prefix"""
+        dir_mtime = self.processed_dir.stat().st_mtime_ns
+        cached = self._latest_file_cache.get(prefix)
+
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        # os.scandir with a prefix/suffix check avoids fnmatch and Path
+        # allocation per entry; the embedded timestamp makes name order
+        # chronological
+        best_name = None
+        with os.scandir(self.processed_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith('.json'):
+                    if best_name is None or name > best_name:
+                        best_name = name
+
+        if best_name is None:
+            return None
+        latest = self.processed_dir / best_name
+        self._latest_file_cache[prefix] = (dir_mtime, latest)
+        return latest
 
     def load_quality_data(self, list_name: str) -> Dict:
         """Load latest quality validation data"""
-        pattern = f"quality_validation_*.json"
-        files = sorted(self.processed_dir.glob(pattern), reverse=True)
+        latest = self._latest_file("quality_validation_")
 
-        if not files:
+        if not latest:
             logger.warning(f"No quality data found")
             return {}
 
-        with open(files[0], 'r') as f:
-            data = json.load(f)
-            return data.get(list_name, {})
+        # The same file holds every list's results; parse it once and
+        # subselect per list
+        data = _load_quality_file(str(latest))
+        return data.get(list_name, {})
 
     def load_velocity_data(self, list_name: str) -> Dict:
         """Load latest velocity data"""
-        pattern = f"velocity_{list_name}_*.json"
-        files = sorted(self.processed_dir.glob(pattern), reverse=True)
+        latest = self._latest_file(f"velocity_{list_name}_")
 
-        if not files:
+        if not latest:
             logger.warning(f"No velocity data found for {list_name}")
             return {}
 
-        with open(files[0], 'r') as f:
-            return json.load(f)
+        return load_json(latest)
 
-    def identify_adoption_leaders(self, velocity_data: Dict, n: int = 5) -> List[Dict]:
+    def _scan_velocities(self, velocity_data: Dict, n: int = 5) -> Tuple[List[Dict], List[Dict], List[Dict]]:
         """
-        Identify technologies with highest adoption velocity
+        Classify all technologies in a single pass over the velocities
 
         Args:
             velocity_data: Velocity report
-            n: Number of leaders to return
+            n: Number of adoption leaders to return
 
         Returns:
-            List of leader dictionaries
+            Tuple of (leaders, emerging, declining) lists
         """
+        memo = self._scan_memo
+        if memo is not None and memo[0] is velocity_data and memo[1] == n:
+            return memo[2]
+
         velocities = velocity_data.get('velocities', [])
         leaders = []
+        emerging = []
+        declining = []
 
         for tech in velocities:
-            github = tech.get('github', {})
-            if 'error' in github or 'momentum_score' not in github:
+            get = tech.get
+            github = get('github', {})
+            if 'error' in github:
                 continue
 
-            momentum = github['momentum_score']
-            leaders.append({
-                'technology': tech['technology'],
-                'category': tech.get('category', 'unknown'),
-                'momentum_score': momentum,
-                'github_stars': github.get('latest_values', {}).get('stars', 0),
-                'velocity_type': github.get('metrics', {}).get('stars_velocity', {}).get('velocity_type', 'unknown')
-            })
+            # Hoist the chained lookups so each level is resolved once
+            # per record (no throwaway empty-dict sentinels)
+            category = get('category', 'unknown')
+            metrics = github.get('metrics') or {}
+            stars_vel = metrics.get('stars_velocity') or {}
+            velocity_type = stars_vel.get('velocity_type')
+            latest = github.get('latest_values') or {}
+            current_stars = latest.get('stars', 0)
+
+            if 'momentum_score' in github:
+                leaders.append({
+                    'technology': tech['technology'],
+                    'category': category,
+                    'momentum_score': github['momentum_score'],
+                    'github_stars': current_stars,
+                    'velocity_type': velocity_type or 'unknown'
+                })
+
+            # Rapid acceleration/emergence vs sustained decline
+            bucket = _BUCKET.get(velocity_type)
+            if bucket == 'emerging':
+                emerging.append({
+                    'technology': tech['technology'],
+                    'category': category,
+                    'velocity_type': velocity_type,
+                    'growth_percentage': stars_vel.get('growth_percentage', 0),
+                    'current_stars': current_stars
+                })
+            elif bucket == 'declining':
+                declining.append({
+                    'technology': tech['technology'],
+                    'category': category,
+                    'velocity_type': velocity_type,
+                    'growth_percentage': stars_vel.get('growth_percentage', 0),
+                    'current_stars': current_stars
+                })
+
+        # Partial sort: O(n log k) for the top n instead of a full sort
+        leaders = heapq.nlargest(n, leaders, key=itemgetter('momentum_score'))
+
+        # Sort emerging by growth rate
+        emerging.sort(key=itemgetter('growth_percentage'), reverse=True)
 
-        # Sort by momentum score
-        leaders.sort(key=lambda x: x['momentum_score'], reverse=True)
-        return leaders[:n]
+        results = (leaders, emerging, declining)
+        self._scan_memo = (velocity_data, n, results)
+        return results
+
+    def identify_adoption_leaders(self, velocity_data: Dict, n: int = 5) -> List[Dict]:
+        """
+        Identify technologies with highest adoption velocity
+
+        Args:
+            velocity_data: Velocity report
+            n: Number of leaders to return
+
+        Returns:
+            List of leader dictionaries
+        """
+        return self._scan_velocities(velocity_data, n)[0]
 
     def identify_hype_candidates(self, quality_data: Dict) -> List[Dict]:
         """
@@ -117,8 +227,9 @@ class InsightGenerator:
         categories = defaultdict(list)
 
         for tech in velocities:
-            category = tech.get('category', 'unknown')
-            github = tech.get('github', {})
+            get = tech.get
+            category = get('category', 'unknown')
+            github = get('github', {})
 
             if 'error' not in github and 'momentum_score' in github:
                 categories[category].append({
@@ -126,19 +237,23 @@ class InsightGenerator:
                     'momentum': github['momentum_score']
                 })
 
-        # Calculate category statistics
+        # Calculate category statistics with C-level numpy reductions
         category_trends = {}
         for category, techs in categories.items():
             if not techs:
                 continue
 
-            momenta = [t['momentum'] for t in techs]
+            momenta = np.fromiter((t['momentum'] for t in techs),
+                                  dtype=np.float64, count=len(techs))
+
             category_trends[category] = {
                 'technology_count': len(techs),
-                'average_momentum': sum(momenta) / len(momenta),
-                'max_momentum': max(momenta),
-                'min_momentum': min(momenta),
-                'technologies': sorted(techs, key=lambda x: x['momentum'], reverse=True)
+                'average_momentum': float(momenta.mean()),
+                'max_momentum': float(momenta.max()),
+                'min_momentum': float(momenta.min()),
+                # Partial sort: only the top technologies are consumed
+                # downstream (report tables, summaries)
+                'technologies': heapq.nlargest(TOP_N_INSIGHTS, techs, key=itemgetter('momentum'))
             }
 
         return category_trends
@@ -153,30 +268,7 @@ class InsightGenerator:
         Returns:
             List of emerging technologies
         """
-        velocities = velocity_data.get('velocities', [])
-        emerging = []
-
-        for tech in velocities:
-            github = tech.get('github', {})
-            if 'error' in github:
-                continue
-
-            metrics = github.get('metrics', {})
-            stars_vel = metrics.get('stars_velocity', {})
-
-            # Check for emergence or rapid growth
-            if stars_vel.get('velocity_type') in ['accelerating', 'new_emergence']:
-                emerging.append({
-                    'technology': tech['technology'],
-                    'category': tech.get('category', 'unknown'),
-                    'velocity_type': stars_vel.get('velocity_type'),
-                    'growth_percentage': stars_vel.get('growth_percentage', 0),
-                    'current_stars': github.get('latest_values', {}).get('stars', 0)
-                })
-
-        # Sort by growth rate
-        emerging.sort(key=lambda x: x.get('growth_percentage', 0), reverse=True)
-        return emerging
+        return self._scan_velocities(velocity_data)[1]
 
     def detect_declining_technologies(self, velocity_data: Dict) -> List[Dict]:
         """
@@ -188,27 +280,7 @@ class InsightGenerator:
         Returns:
             List of declining technologies
         """
-        velocities = velocity_data.get('velocities', [])
-        declining = []
-
-        for tech in velocities:
-            github = tech.get('github', {})
-            if 'error' in github:
-                continue
-
-            metrics = github.get('metrics', {})
-            stars_vel = metrics.get('stars_velocity', {})
-
-            if stars_vel.get('velocity_type') in ['declining', 'collapsing']:
-                declining.append({
-                    'technology': tech['technology'],
-                    'category': tech.get('category', 'unknown'),
-                    'velocity_type': stars_vel.get('velocity_type'),
-                    'growth_percentage': stars_vel.get('growth_percentage', 0),
-                    'current_stars': github.get('latest_values', {}).get('stars', 0)
-                })
-
-        return declining
+        return self._scan_velocities(velocity_data)[2]
 
     def generate_executive_summary(self, insights: Dict) -> str:
         """
@@ -288,8 +360,10 @@ class InsightGenerator:
             'data_quality_summary': quality_data.get('summary', {}),
         }
 
+        # Classify leaders/emerging/declining in one velocity pass
+        leaders, emerging, declining = self._scan_velocities(velocity_data, TOP_N_INSIGHTS)
+
         # Adoption leaders
-        leaders = self.identify_adoption_leaders(velocity_data, TOP_N_INSIGHTS)
         insights['adoption_leaders'] = leaders
         logger.info(f"\nTop {len(leaders)} adoption leaders identified")
         for i, leader in enumerate(leaders, 1):
@@ -311,7 +385,6 @@ class InsightGenerator:
             logger.info(f"  {cat}: {data['average_momentum']:.1f}% avg momentum ({data['technology_count']} techs)")
 
         # Emerging technologies
-        emerging = self.detect_emerging_technologies(velocity_data)
         insights['emerging_technologies'] = emerging
         if emerging:
             logger.info(f"\n🚀 {len(emerging)} emerging technologies:")
@@ -319,7 +392,6 @@ class InsightGenerator:
                 logger.info(f"  - {tech['technology']}: {tech['growth_percentage']:.1f}% growth")
 
         # Declining technologies
-        declining = self.detect_declining_technologies(velocity_data)
         insights['declining_technologies'] = declining
         if declining:
             logger.info(f"\n📉 {len(declining)} declining technologies")
@@ -345,18 +417,27 @@ def generate_all_insights() -> Dict[str, Dict]:
     from ..utils.config import ACTIVE_LISTS
 
     generator = InsightGenerator()
-    results = {}
 
-    for list_name in ACTIVE_LISTS.keys():
+    # One timestamp for the whole run, so all per-list files share it
+    # even when generation straddles a second boundary
+    run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    def _generate_one(list_name: str) -> Dict:
         insights = generator.generate_insights(list_name)
-        results[list_name] = insights
 
         # Save insights
-        output_file = PROCESSED_DATA_DIR / f'insights_{list_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(output_file, 'w') as f:
-            json.dump(insights, f, indent=2)
+        output_file = PROCESSED_DATA_DIR / f'insights_{list_name}_{run_ts}.json'
+        dump_json(insights, output_file)
         logger.info(f"\nSaved insights to {output_file}")
 
+        return insights
+
+    # Lists are independent (I/O plus pure-Python compute per list),
+    # so generate them concurrently
+    list_names = list(ACTIVE_LISTS)
+    with ThreadPoolExecutor(max_workers=len(list_names)) as executor:
+        results = dict(zip(list_names, executor.map(_generate_one, list_names)))
+
     return results
 
 
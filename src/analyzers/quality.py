@@ -3,16 +3,89 @@ Data Quality Checker
 Cross-validates signals across multiple sources to detect hype vs real adoption
 """
 
-import json
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..utils.config import RAW_DATA_DIR, MIN_SOURCES_FOR_HIGH_CONFIDENCE, DIVERGENCE_THRESHOLD
+from ..utils.jsonio import dump_json, load_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# Translation table deleting '-' and '_' in one C-level pass
+_NORM_TRANS = str.maketrans('', '', '-_')
+
+
+def _extract_github(data: Dict) -> Dict:
+    """Extract key GitHub metrics from a collected record"""
+    get = data.get
+    return {
+        'source': 'github',
+        'technology': get('technology'),
+        'collected_at': get('collected_at'),
+        'stars': get('stars', 0),
+        'forks': get('forks', 0),
+        'open_issues': get('open_issues', 0),
+        'watchers': get('watchers', 0),
+        'contributors': (get('contributors') or {}).get('total_contributors', 0),
+        'commits_last_year': (get('commit_activity') or {}).get('total_commits_last_year', 0),
+    }
+
+
+def _extract_npm(data: Dict) -> Dict:
+    """Extract key npm metrics from a collected record"""
+    get = data.get
+    metrics = {
+        'source': 'npm',
+        'technology': get('technology'),
+        'collected_at': get('collected_at'),
+    }
+    if 'error' not in data:
+        downloads_30 = get('downloads_30_day') or {}
+        metrics.update({
+            'downloads_last_week': get('downloads_last_week', 0),
+            'downloads_last_month': get('downloads_last_month', 0),
+            'downloads_30_day_total': downloads_30.get('total_downloads', 0),
+            'downloads_30_day_avg': downloads_30.get('daily_average', 0),
+        })
+    return metrics
+
+
+def _extract_pypi(data: Dict) -> Dict:
+    """Extract key PyPI metrics from a collected record"""
+    get = data.get
+    metrics = {
+        'source': 'pypi',
+        'technology': get('technology'),
+        'collected_at': get('collected_at'),
+    }
+    if 'error' not in data:
+        recent = get('downloads_recent') or {}
+        overall = get('downloads_overall') or {}
+        metrics.update({
+            'downloads_last_day': recent.get('last_day', 0),
+            'downloads_last_week': recent.get('last_week', 0),
+            'downloads_last_month': recent.get('last_month', 0),
+            'downloads_30_day_total': overall.get('total_downloads_30_day', 0),
+            'downloads_30_day_avg': overall.get('average_daily', 0),
+        })
+    return metrics
+
+
+# Dispatch table: one dict lookup per record instead of an if/elif
+# chain comparing source strings
+_EXTRACTORS = {
+    'github': _extract_github,
+    'npm': _extract_npm,
+    'pypi': _extract_pypi,
+}
+
 
 class DataQualityChecker:
     """Validates data quality through multi-source cross-validation"""
@@ -20,6 +93,9 @@ class DataQualityChecker:
     def __init__(self):
         """Initialize quality checker"""
         self.raw_data_dir = RAW_DATA_DIR
+        # Latest-file lookups keyed by (list_name, source), validated
+        # against the directory mtime so fresh collections invalidate
+        self._latest_file_cache: Dict[Tuple[str, str], Tuple[int, Path]] = {}
 
     def load_latest_data(self, list_name: str, source: str) -> Optional[List[Dict]]:
         """
@@ -37,20 +113,37 @@ class DataQualityChecker:
             logger.warning(f"Data directory not found: {data_dir}")
             return None
 
-        # Find latest file for this source
-        pattern = f"{source}_*.json"
-        files = sorted(data_dir.glob(pattern), reverse=True)
+        # Find latest file for this source, reusing the cached result
+        # while the directory is unchanged
+        dir_mtime = data_dir.stat().st_mtime_ns
+        cache_key = (list_name, source)
+        cached = self._latest_file_cache.get(cache_key)
 
-        if not files:
-            logger.warning(f"No {source} data found for {list_name}")
-            return None
+        if cached is not None and cached[0] == dir_mtime:
+            latest_file = cached[1]
+        else:
+            # os.scandir with a prefix/suffix check avoids fnmatch and
+            # Path allocation per entry; the embedded timestamp makes
+            # name order chronological
+            prefix = f"{source}_"
+            best_name = None
+            with os.scandir(data_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith(prefix) and name.endswith('.json'):
+                        if best_name is None or name > best_name:
+                            best_name = name
+
+            if best_name is None:
+                logger.warning(f"No {source} data found for {list_name}")
+                return None
+            latest_file = data_dir / best_name
+            self._latest_file_cache[cache_key] = (dir_mtime, latest_file)
 
-        latest_file = files[0]
         logger.info(f"Loading {source} data from {latest_file.name}")
 
         try:
-            with open(latest_file, 'r') as f:
-                return json.load(f)
+            return load_json(latest_file)
         except Exception as e:
             logger.error(f"Error loading {latest_file}: {e}")
             return None
@@ -65,7 +158,7 @@ class DataQualityChecker:
         Returns:
             Normalized name
         """
-        return name.lower().replace('-', '').replace('_', '').strip()
+        return name.strip().translate(_NORM_TRANS).lower()
 
     def extract_metrics(self, data: Dict, source: str) -> Dict:
         """
@@ -78,44 +171,14 @@ class DataQualityChecker:
         Returns:
             Normalized metrics dictionary
         """
-        metrics = {
-            'source': source,
-            'technology': data.get('technology'),
-            'collected_at': data.get('collected_at'),
-        }
-
-        if source == 'github':
-            metrics.update({
-                'stars': data.get('stars', 0),
-                'forks': data.get('forks', 0),
-                'open_issues': data.get('open_issues', 0),
-                'watchers': data.get('watchers', 0),
-                'contributors': data.get('contributors', {}).get('total_contributors', 0),
-                'commits_last_year': data.get('commit_activity', {}).get('total_commits_last_year', 0),
-            })
-
-        elif source == 'npm':
-            if 'error' not in data:
-                metrics.update({
-                    'downloads_last_week': data.get('downloads_last_week', 0),
-                    'downloads_last_month': data.get('downloads_last_month', 0),
-                    'downloads_30_day_total': data.get('downloads_30_day', {}).get('total_downloads', 0),
-                    'downloads_30_day_avg': data.get('downloads_30_day', {}).get('daily_average', 0),
-                })
-
-        elif source == 'pypi':
-            if 'error' not in data:
-                recent = data.get('downloads_recent', {})
-                overall = data.get('downloads_overall', {})
-                metrics.update({
-                    'downloads_last_day': recent.get('last_day', 0),
-                    'downloads_last_week': recent.get('last_week', 0),
-                    'downloads_last_month': recent.get('last_month', 0),
-                    'downloads_30_day_total': overall.get('total_downloads_30_day', 0),
-                    'downloads_30_day_avg': overall.get('average_daily', 0),
-                })
-
-        return metrics
+        extractor = _EXTRACTORS.get(source)
+        if extractor is None:
+            return {
+                'source': source,
+                'technology': data.get('technology'),
+                'collected_at': data.get('collected_at'),
+            }
+        return extractor(data)
 
     def merge_sources(self, list_name: str) -> Dict[str, Dict]:
         """
@@ -134,35 +197,24 @@ class DataQualityChecker:
         npm_data = self.load_latest_data(list_name, 'npm') or []
         pypi_data = self.load_latest_data(list_name, 'pypi') or []
 
-        # Build merged dictionary
+        # Build merged dictionary in one pass over all sources.
+        # setdefault does a single dict lookup per record, and the
+        # bound methods are hoisted out of the loop.
         merged = {}
+        normalize = self.normalize_technology_name
 
-        # Process GitHub data
-        for item in github_data:
-            tech_name = item.get('technology')
-            if tech_name:
-                normalized = self.normalize_technology_name(tech_name)
-                if normalized not in merged:
-                    merged[normalized] = {'technology': tech_name, 'sources': {}}
-                merged[normalized]['sources']['github'] = self.extract_metrics(item, 'github')
-
-        # Process npm data
-        for item in npm_data:
-            tech_name = item.get('technology')
-            if tech_name:
-                normalized = self.normalize_technology_name(tech_name)
-                if normalized not in merged:
-                    merged[normalized] = {'technology': tech_name, 'sources': {}}
-                merged[normalized]['sources']['npm'] = self.extract_metrics(item, 'npm')
+        sources_iter = chain(
+            ((item, 'github') for item in github_data),
+            ((item, 'npm') for item in npm_data),
+            ((item, 'pypi') for item in pypi_data),
+        )
 
-        # Process PyPI data
-        for item in pypi_data:
+        for item, source in sources_iter:
             tech_name = item.get('technology')
             if tech_name:
-                normalized = self.normalize_technology_name(tech_name)
-                if normalized not in merged:
-                    merged[normalized] = {'technology': tech_name, 'sources': {}}
-                merged[normalized]['sources']['pypi'] = self.extract_metrics(item, 'pypi')
+                normalized = normalize(tech_name)
+                entry = merged.setdefault(normalized, {'technology': tech_name, 'sources': {}})
+                entry['sources'][source] = _EXTRACTORS[source](item)
 
         logger.info(f"Merged data for {len(merged)} technologies")
         return merged
@@ -261,14 +313,12 @@ class DataQualityChecker:
             'validated_at': datetime.now().isoformat(),
             'total_technologies': len(merged_data),
             'technologies': [],
-            'summary': {
-                'high_confidence': 0,
-                'medium_confidence': 0,
-                'low_confidence': 0,
-                'hype_detected': 0,
-            }
         }
 
+        # Tally confidence levels and hype flags in a Counter and
+        # translate to the summary keys once after the loop
+        counter = Counter()
+
         for tech_key, tech_data in merged_data.items():
             tech_name = tech_data['technology']
             sources = tech_data['sources']
@@ -293,21 +343,24 @@ class DataQualityChecker:
             validation_report['technologies'].append(tech_validation)
 
             # Update summary
-            if confidence == "HIGH":
-                validation_report['summary']['high_confidence'] += 1
-            elif confidence == "MEDIUM":
-                validation_report['summary']['medium_confidence'] += 1
-            elif confidence == "LOW":
-                validation_report['summary']['low_confidence'] += 1
-
+            counter[confidence] += 1
             if is_hype:
-                validation_report['summary']['hype_detected'] += 1
+                counter['hype'] += 1
 
-            # Log findings
-            logger.info(f"\n{tech_name}:")
-            logger.info(f"  Confidence: {confidence} ({len(available)} sources)")
+            # Log findings; the gate skips per-tech formatting entirely
+            # when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s:", tech_name)
+                logger.info("  Confidence: %s (%d sources)", confidence, len(available))
             if is_hype:
-                logger.warning(f"  ⚠️  Hype detected: {', '.join(hype_reasons)}")
+                logger.warning("  ⚠️  Hype detected: %s", ', '.join(hype_reasons))
+
+        validation_report['summary'] = {
+            'high_confidence': counter['HIGH'],
+            'medium_confidence': counter['MEDIUM'],
+            'low_confidence': counter['LOW'],
+            'hype_detected': counter['hype'],
+        }
 
         return validation_report
 
@@ -322,11 +375,11 @@ def validate_all_lists() -> Dict[str, Dict]:
     from ..utils.config import ACTIVE_LISTS
 
     checker = DataQualityChecker()
-    results = {}
 
-    for list_name in ACTIVE_LISTS.keys():
-        report = checker.validate_list(list_name)
-        results[list_name] = report
+    # Lists validate independently, so run them concurrently
+    list_names = list(ACTIVE_LISTS)
+    with ThreadPoolExecutor(max_workers=len(list_names)) as executor:
+        results = dict(zip(list_names, executor.map(checker.validate_list, list_names)))
 
     # Print summary
     logger.info("\n" + "="*60)
@@ -335,12 +388,12 @@ def validate_all_lists() -> Dict[str, Dict]:
 
     for list_name, report in results.items():
         summary = report['summary']
-        logger.info(f"\n{list_name.upper()}:")
-        logger.info(f"  Total technologies: {report['total_technologies']}")
-        logger.info(f"  High confidence: {summary['high_confidence']}")
-        logger.info(f"  Medium confidence: {summary['medium_confidence']}")
-        logger.info(f"  Low confidence: {summary['low_confidence']}")
-        logger.info(f"  Hype detected: {summary['hype_detected']}")
+        logger.info("\n%s:", list_name.upper())
+        logger.info("  Total technologies: %d", report['total_technologies'])
+        logger.info("  High confidence: %d", summary['high_confidence'])
+        logger.info("  Medium confidence: %d", summary['medium_confidence'])
+        logger.info("  Low confidence: %d", summary['low_confidence'])
+        logger.info("  Hype detected: %d", summary['hype_detected'])
 
     return results
 
@@ -352,6 +405,5 @@ if __name__ == "__main__":
     # Save results
     from ..utils.config import PROCESSED_DATA_DIR
     output_file = PROCESSED_DATA_DIR / f'quality_validation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    dump_json(results, output_file)
     print(f"\nValidation results saved to {output_file}")
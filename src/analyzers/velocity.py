@@ -4,17 +4,82 @@ Calculates growth rates and momentum for technology adoption
 Focus on rate of change over absolute numbers
 """
 
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict
 
+import numpy as np
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from ..utils.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, VELOCITY_SPIKE_THRESHOLD
+from ..utils.jsonio import dump_json, load_json, load_ndjson
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# Files larger than this are streamed for single-tech lookups instead
+# of being fully parsed and indexed
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Momentum weights for (stars, forks, watchers) growth percentages
+_MOMENTUM_WEIGHTS = np.array([0.5, 0.3, 0.2])
+
+# velocity_type labels indexed by the classifier code returned from
+# _velocity_core
+_TYPE_LABELS = ('collapsing', 'declining', 'stable', 'growing', 'accelerating',
+                'new_emergence', 'no_activity')
+
+
+def _file_timestamp(path: Path) -> datetime:
+    """Parse the collection timestamp embedded in a raw data filename
+
+    Filenames are screened by get_historical_files, so the trailing
+    %Y%m%d_%H%M%S part is well formed; integer slicing avoids strptime.
+    """
+    ts = path.stem[-15:]
+    return datetime(int(ts[0:4]), int(ts[4:6]), int(ts[6:8]),
+                    int(ts[9:11]), int(ts[11:13]), int(ts[13:15]))
+
+
+@lru_cache(maxsize=4096)
+def _velocity_core(current: float, previous: float, dt_days: float) -> Tuple[float, float, float, int, bool]:
+    """Pure-arithmetic velocity kernel
+
+    Returns (growth_rate, growth_percentage, absolute_change,
+    type_code, is_anomaly) with type_code indexing _TYPE_LABELS. Kept
+    free of dict/string work so the hot arithmetic stays tight. The
+    function is pure, so repeated invocations in the same process
+    (tests, notebooks, dashboards) hit the lru_cache.
+    """
+    if previous == 0:
+        if current > 0:
+            return float('inf'), float('inf'), current, 5, current > 10000
+        return 0.0, 0.0, 0.0, 6, False
+
+    absolute_change = current - previous
+    growth_rate = absolute_change / previous
+
+    # Normalize to monthly rate
+    monthly_growth_rate = growth_rate * (30.0 / dt_days)
+    monthly_growth_percentage = monthly_growth_rate * 100
+
+    is_anomaly = abs(monthly_growth_rate) > VELOCITY_SPIKE_THRESHOLD
+
+    # Branchless classification: count how many thresholds the monthly
+    # percentage clears, giving 0 (collapsing) .. 4 (accelerating)
+    m = monthly_growth_percentage
+    type_code = (m > -50) + (m > -10) + (m > 10) + (m > 50)
+
+    return (monthly_growth_rate, monthly_growth_percentage, absolute_change,
+            type_code, is_anomaly)
+
 
 class VelocityCalculator:
     """Calculates adoption velocity and momentum metrics"""
@@ -23,6 +88,111 @@ class VelocityCalculator:
         """Initialize velocity calculator"""
         self.raw_data_dir = RAW_DATA_DIR
         self.processed_data_dir = PROCESSED_DATA_DIR
+        # Parsed-JSON cache keyed by path, validated on (mtime, size).
+        # The same latest/oldest files are consulted once per technology
+        # in a list, so unchanged files are parsed exactly once.
+        self._json_cache: Dict[Path, Tuple[int, int, object]] = {}
+        # Per-file {technology: record} indexes, same validation scheme
+        self._index_cache: Dict[Path, Tuple[int, int, Dict[str, Dict]]] = {}
+        # Historical-file listings per (list, source, days), validated
+        # against the data directory mtime
+        self._files_cache: Dict[Tuple[str, str, int], Tuple[int, List[Path]]] = {}
+        # Parsed per-list _index.ndjson files, validated on (mtime, size)
+        self._dir_index_cache: Dict[Path, Tuple[int, int, List[Dict]]] = {}
+
+    def _collection_index(self, data_dir: Path) -> Optional[List[Dict]]:
+        """Load the collector-maintained file index, if one exists"""
+        index_path = data_dir / '_index.ndjson'
+        try:
+            stat = index_path.stat()
+        except OSError:
+            return None
+
+        cached = self._dir_index_cache.get(index_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        try:
+            entries = load_ndjson(index_path)
+        except Exception as e:
+            logger.warning(f"Could not read collection index {index_path}: {e}")
+            return None
+
+        self._dir_index_cache[index_path] = (stat.st_mtime_ns, stat.st_size, entries)
+        return entries
+
+    def _load_json(self, path: Path):
+        """Load a JSON file through the per-file cache"""
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(path)
+
+        if cached is not None and cached[0] == key[0] and cached[1] == key[1]:
+            return cached[2]
+
+        data = load_json(path)
+        self._json_cache[path] = (key[0], key[1], data)
+        return data
+
+    @staticmethod
+    def _prefer_slim(path: Path) -> Path:
+        """Redirect to the slim companion the collector writes, if any
+
+        It carries just the fields velocity reads, skipping the large
+        weekly_activity/topics payloads (github) and package metadata
+        (npm/pypi).
+        """
+        for source in ('github', 'npm', 'pypi'):
+            prefix = source + '_'
+            if path.name.startswith(prefix):
+                slim_path = path.with_name(
+                    f'{source}-slim_' + path.name[len(prefix):])
+                if slim_path.exists():
+                    return slim_path
+                break
+        return path
+
+    def _find_tech_record(self, path: Path, tech_name: str) -> Optional[Dict]:
+        """Find one technology's record in a raw data file
+
+        Large files are streamed with ijson (when installed) and the
+        scan stops at the target record; smaller files go through the
+        cached full-parse index.
+        """
+        path = self._prefer_slim(path)
+
+        if ijson is not None and path not in self._index_cache \
+                and path.stat().st_size > _STREAM_THRESHOLD:
+            with open(path, 'rb') as f:
+                # zstd-compressed dumps can't be streamed incrementally;
+                # let those fall through to the full-parse index, which
+                # decompresses via load_json
+                if f.read(4) != b'\x28\xb5\x2f\xfd':
+                    f.seek(0)
+                    return next((t for t in ijson.items(f, 'item')
+                                 if t.get('technology') == tech_name), None)
+
+        return self._load_tech_index(path).get(tech_name)
+
+    def _load_tech_index(self, path: Path) -> Dict[str, Dict]:
+        """Load a raw data file as a {technology: record} index
+
+        Built once per file alongside the JSON cache, so per-tech
+        lookups are O(1) dict hits instead of O(n) list scans.
+        """
+        path = self._prefer_slim(path)
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._index_cache.get(path)
+
+        if cached is not None and cached[0] == key[0] and cached[1] == key[1]:
+            return cached[2]
+
+        data = self._load_json(path)
+        index = {t['technology']: t for t in data
+                 if isinstance(t, dict) and 'technology' in t}
+        self._index_cache[path] = (key[0], key[1], index)
+        return index
 
     def get_historical_files(self, list_name: str, source: str, days: int = 30) -> List[Path]:
         """
@@ -40,20 +210,55 @@ class VelocityCalculator:
         if not data_dir.exists():
             return []
 
-        cutoff_date = datetime.now() - timedelta(days=days)
-        files = []
-
-        for file in data_dir.glob(f"{source}_*.json"):
-            # Extract timestamp from filename
-            try:
-                timestamp_str = file.stem.split('_', 1)[1]
-                file_date = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                if file_date >= cutoff_date:
-                    files.append(file)
-            except Exception:
-                continue
-
-        return sorted(files)
+        # Reuse the listing while the directory is unchanged; this is
+        # called once per technology per source otherwise
+        dir_mtime = data_dir.stat().st_mtime_ns
+        cache_key = (list_name, source, days)
+        cached = self._files_cache.get(cache_key)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+
+        # Compare the filename timestamp lexicographically against a
+        # precomputed cutoff string — same ordering as strptime for the
+        # zero-padded %Y%m%d_%H%M%S format, without per-file parsing
+        cutoff_str = (datetime.now() - timedelta(days=days)).strftime('%Y%m%d_%H%M%S')
+
+        # Prefer the collector-maintained index over scanning the
+        # directory; fall back to os.scandir when this source has no
+        # index entries (e.g. pre-index data)
+        entries = self._collection_index(data_dir)
+        if entries is not None:
+            source_entries = [e for e in entries if e.get('source') == source]
+            if source_entries:
+                # The set guards against a file indexed twice (a crash
+                # between seeding and the per-run append can do that)
+                names = sorted({e['path'] for e in source_entries
+                                if e.get('timestamp', '') >= cutoff_str})
+                files = [data_dir / name for name in names]
+                self._files_cache[cache_key] = (dir_mtime, files)
+                return files
+
+        prefix = f"{source}_"
+        prefix_len = len(prefix)
+        names = []
+
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith('.json')):
+                    continue
+                timestamp_str = name[prefix_len:-5]
+                # Malformed names sort wrongly rather than raising, so
+                # screen the shape explicitly
+                if len(timestamp_str) != 15 or not timestamp_str.replace('_', '').isdigit():
+                    continue
+                if timestamp_str >= cutoff_str:
+                    names.append(name)
+
+        names.sort()
+        files = [data_dir / name for name in names]
+        self._files_cache[cache_key] = (dir_mtime, files)
+        return files
 
     def calculate_simple_velocity(self, current: float, previous: float,
                                   time_delta_days: float = 30) -> Dict:
@@ -68,57 +273,181 @@ class VelocityCalculator:
         Returns:
             Velocity metrics dictionary
         """
-        if previous == 0:
-            if current > 0:
-                return {
-                    'growth_rate': float('inf'),
-                    'growth_percentage': float('inf'),
-                    'absolute_change': current,
-                    'velocity_type': 'new_emergence',
-                    'is_anomaly': current > 10000  # Large sudden appearance
-                }
-            else:
-                return {
-                    'growth_rate': 0,
-                    'growth_percentage': 0,
-                    'absolute_change': 0,
-                    'velocity_type': 'no_activity',
-                    'is_anomaly': False
-                }
-
-        absolute_change = current - previous
-        growth_rate = absolute_change / previous
-        growth_percentage = growth_rate * 100
-
-        # Normalize to monthly rate
-        monthly_factor = 30 / time_delta_days
-        monthly_growth_rate = growth_rate * monthly_factor
-        monthly_growth_percentage = monthly_growth_rate * 100
-
-        # Detect anomalies
-        is_anomaly = abs(monthly_growth_rate) > VELOCITY_SPIKE_THRESHOLD
-
-        # Classify velocity
-        if monthly_growth_percentage > 50:
-            velocity_type = 'accelerating'
-        elif monthly_growth_percentage > 10:
-            velocity_type = 'growing'
-        elif monthly_growth_percentage > -10:
-            velocity_type = 'stable'
-        elif monthly_growth_percentage > -50:
-            velocity_type = 'declining'
-        else:
-            velocity_type = 'collapsing'
+        growth_rate, growth_pct, abs_change, type_code, is_anomaly = \
+            _velocity_core(current, previous, time_delta_days)
+
+        if type_code >= 5:
+            # Zero baseline: no time normalization applies
+            return {
+                'growth_rate': growth_rate,
+                'growth_percentage': growth_pct,
+                'absolute_change': abs_change,
+                'velocity_type': _TYPE_LABELS[type_code],
+                'is_anomaly': is_anomaly
+            }
 
         return {
-            'growth_rate': monthly_growth_rate,
-            'growth_percentage': monthly_growth_percentage,
-            'absolute_change': absolute_change,
-            'velocity_type': velocity_type,
+            'growth_rate': growth_rate,
+            'growth_percentage': growth_pct,
+            'absolute_change': abs_change,
+            'velocity_type': _TYPE_LABELS[type_code],
             'is_anomaly': is_anomaly,
             'time_delta_days': time_delta_days
         }
 
+    def _vectorized_simple_velocity(self, current: np.ndarray, previous: np.ndarray,
+                                    dt_days: np.ndarray) -> List[Dict]:
+        """
+        Vectorized calculate_simple_velocity over metric arrays
+
+        Args:
+            current: Current values, one per technology
+            previous: Previous values, one per technology
+            dt_days: Time delta in days, one per technology
+
+        Returns:
+            List of velocity dictionaries, same order as the inputs
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth_rate = (current - previous) / previous
+            monthly = growth_rate * (30.0 / dt_days)
+        monthly_pct = monthly * 100
+        is_anomaly = np.abs(monthly) > VELOCITY_SPIKE_THRESHOLD
+        # Same branchless threshold count as _velocity_core, indexing
+        # into the shared label table
+        type_idx = ((monthly_pct > -50).astype(np.int8) + (monthly_pct > -10)
+                    + (monthly_pct > 10) + (monthly_pct > 50))
+        velocity_type = np.asarray(_TYPE_LABELS[:5])[type_idx]
+
+        results = []
+        for i in range(len(current)):
+            prev = previous[i]
+            if prev == 0:
+                # Same special cases as the scalar path
+                cur = current[i]
+                if cur > 0:
+                    results.append({
+                        'growth_rate': float('inf'),
+                        'growth_percentage': float('inf'),
+                        'absolute_change': float(cur),
+                        'velocity_type': 'new_emergence',
+                        'is_anomaly': bool(cur > 10000)
+                    })
+                else:
+                    results.append({
+                        'growth_rate': 0,
+                        'growth_percentage': 0,
+                        'absolute_change': 0,
+                        'velocity_type': 'no_activity',
+                        'is_anomaly': False
+                    })
+            else:
+                results.append({
+                    'growth_rate': float(monthly[i]),
+                    'growth_percentage': float(monthly_pct[i]),
+                    'absolute_change': float(current[i] - prev),
+                    'velocity_type': str(velocity_type[i]),
+                    'is_anomaly': bool(is_anomaly[i]),
+                    'time_delta_days': float(dt_days[i])
+                })
+        return results
+
+    def _batch_github_velocities(self, list_name: str, tech_names: List[str]) -> Dict[str, Dict]:
+        """
+        Compute GitHub velocities for many technologies in one pass
+
+        Loads the latest/oldest files once and runs the growth-rate
+        arithmetic and classification over NumPy arrays covering every
+        technology, instead of per-tech scalar calls.
+
+        Args:
+            list_name: List name
+            tech_names: Technologies to compute
+
+        Returns:
+            Dictionary mapping technology names to velocity results
+        """
+        files = self.get_historical_files(list_name, 'github')
+
+        if len(files) < 2:
+            logger.warning(f"Need at least 2 data points for velocity calculation in {list_name}")
+            return {name: {'error': 'insufficient_data'} for name in tech_names}
+
+        try:
+            latest_index = self._load_tech_index(files[-1])
+            oldest_index = self._load_tech_index(files[0])
+        except Exception as e:
+            logger.error(f"Error loading files: {e}")
+            return {name: {'error': 'file_load_error'} for name in tech_names}
+
+        # Every record in a file shares the file's collection time, so
+        # the delta is computed once per file pair from the filenames
+        time_delta_days = (_file_timestamp(files[-1]) - _file_timestamp(files[0])).total_seconds() / 86400
+
+        if time_delta_days < 1:
+            return {name: {'error': 'insufficient_time_delta'} for name in tech_names}
+
+        results: Dict[str, Dict] = {}
+        valid: List[Tuple[str, Dict]] = []
+
+        for name in tech_names:
+            latest_tech = latest_index.get(name)
+            oldest_tech = oldest_index.get(name)
+
+            if not latest_tech or not oldest_tech:
+                results[name] = {'error': 'technology_not_found'}
+                continue
+
+            valid.append((name, latest_tech))
+            # oldest_tech is re-fetched below from the index (cheap dict hit)
+
+        if not valid:
+            return results
+
+        n = len(valid)
+        dt = np.full(n, time_delta_days, dtype=np.float64)
+        metric_results: Dict[str, List[Dict]] = {}
+
+        for key in ['stars', 'forks', 'watchers', 'open_issues']:
+            current = np.array([t[1].get(key, 0) for t in valid], dtype=np.float64)
+            previous = np.array([oldest_index[t[0]].get(key, 0) for t in valid], dtype=np.float64)
+            metric_results[key] = self._vectorized_simple_velocity(current, previous, dt)
+
+        for i, (name, latest_tech) in enumerate(valid):
+            metrics = {f'{key}_velocity': metric_results[key][i]
+                       for key in ['stars', 'forks', 'watchers', 'open_issues']}
+            results[name] = self._github_report(metrics, latest_tech, time_delta_days)
+
+        return results
+
+    @staticmethod
+    def _github_report(metrics: Dict, latest_tech: Dict, time_delta_days: float) -> Dict:
+        """Assemble the GitHub velocity payload from computed metrics"""
+        # Overall GitHub momentum score (weighted average). Replacing
+        # infinities (new-emergence baselines) with ±100 in one
+        # nan_to_num call instead of per-field sentinel branches.
+        growths = np.nan_to_num(
+            np.array([
+                metrics.get('stars_velocity', {}).get('growth_percentage', 0),
+                metrics.get('forks_velocity', {}).get('growth_percentage', 0),
+                metrics.get('watchers_velocity', {}).get('growth_percentage', 0),
+            ], dtype=np.float64),
+            nan=0.0, posinf=100.0, neginf=-100.0
+        )
+        momentum_score = float(growths @ _MOMENTUM_WEIGHTS)
+
+        return {
+            'source': 'github',
+            'metrics': metrics,
+            'momentum_score': momentum_score,
+            'time_period_days': time_delta_days,
+            'latest_values': {
+                'stars': latest_tech.get('stars', 0),
+                'forks': latest_tech.get('forks', 0),
+                'watchers': latest_tech.get('watchers', 0),
+            }
+        }
+
     def calculate_github_velocity(self, tech_name: str, list_name: str) -> Dict:
         """
         Calculate velocity metrics for GitHub data
@@ -141,25 +470,19 @@ class VelocityCalculator:
         oldest_file = files[0]
 
         try:
-            with open(latest_file, 'r') as f:
-                latest_data = json.load(f)
-            with open(oldest_file, 'r') as f:
-                oldest_data = json.load(f)
+            # Single-tech path: streamed lookup for large files
+            latest_tech = self._find_tech_record(latest_file, tech_name)
+            oldest_tech = self._find_tech_record(oldest_file, tech_name)
         except Exception as e:
             logger.error(f"Error loading files: {e}")
             return {'error': 'file_load_error'}
 
-        # Find technology in both datasets
-        latest_tech = next((t for t in latest_data if t.get('technology') == tech_name), None)
-        oldest_tech = next((t for t in oldest_data if t.get('technology') == tech_name), None)
-
         if not latest_tech or not oldest_tech:
             return {'error': 'technology_not_found'}
 
-        # Calculate time delta
-        latest_time = datetime.fromisoformat(latest_tech['collected_at'])
-        oldest_time = datetime.fromisoformat(oldest_tech['collected_at'])
-        time_delta_days = (latest_time - oldest_time).total_seconds() / 86400
+        # Calculate time delta once from the file timestamps; every
+        # record in a file shares the file's collection time
+        time_delta_days = (_file_timestamp(latest_file) - _file_timestamp(oldest_file)).total_seconds() / 86400
 
         if time_delta_days < 1:
             return {'error': 'insufficient_time_delta'}
@@ -174,40 +497,7 @@ class VelocityCalculator:
                 current, previous, time_delta_days
             )
 
-        # Overall GitHub momentum score (weighted average)
-        stars_weight = 0.5
-        forks_weight = 0.3
-        watchers_weight = 0.2
-
-        stars_growth = metrics.get('stars_velocity', {}).get('growth_percentage', 0)
-        forks_growth = metrics.get('forks_velocity', {}).get('growth_percentage', 0)
-        watchers_growth = metrics.get('watchers_velocity', {}).get('growth_percentage', 0)
-
-        # Handle infinity
-        if stars_growth == float('inf'):
-            stars_growth = 100
-        if forks_growth == float('inf'):
-            forks_growth = 100
-        if watchers_growth == float('inf'):
-            watchers_growth = 100
-
-        momentum_score = (
-            stars_growth * stars_weight +
-            forks_growth * forks_weight +
-            watchers_growth * watchers_weight
-        )
-
-        return {
-            'source': 'github',
-            'metrics': metrics,
-            'momentum_score': momentum_score,
-            'time_period_days': time_delta_days,
-            'latest_values': {
-                'stars': latest_tech.get('stars', 0),
-                'forks': latest_tech.get('forks', 0),
-                'watchers': latest_tech.get('watchers', 0),
-            }
-        }
+        return self._github_report(metrics, latest_tech, time_delta_days)
 
     def calculate_downloads_velocity(self, tech_name: str, list_name: str, source: str) -> Dict:
         """
@@ -230,17 +520,12 @@ class VelocityCalculator:
         oldest_file = files[0]
 
         try:
-            with open(latest_file, 'r') as f:
-                latest_data = json.load(f)
-            with open(oldest_file, 'r') as f:
-                oldest_data = json.load(f)
+            latest_tech = self._find_tech_record(latest_file, tech_name)
+            oldest_tech = self._find_tech_record(oldest_file, tech_name)
         except Exception as e:
             logger.error(f"Error loading {source} files: {e}")
             return {'error': 'file_load_error'}
 
-        latest_tech = next((t for t in latest_data if t.get('technology') == tech_name), None)
-        oldest_tech = next((t for t in oldest_data if t.get('technology') == tech_name), None)
-
         if not latest_tech or not oldest_tech:
             return {'error': 'technology_not_found'}
 
@@ -248,10 +533,8 @@ class VelocityCalculator:
         if 'error' in latest_tech or 'error' in oldest_tech:
             return {'error': 'data_collection_error'}
 
-        # Calculate time delta
-        latest_time = datetime.fromisoformat(latest_tech['collected_at'])
-        oldest_time = datetime.fromisoformat(oldest_tech['collected_at'])
-        time_delta_days = (latest_time - oldest_time).total_seconds() / 86400
+        # Calculate time delta once from the file timestamps
+        time_delta_days = (_file_timestamp(latest_file) - _file_timestamp(oldest_file)).total_seconds() / 86400
 
         if time_delta_days < 1:
             return {'error': 'insufficient_time_delta'}
@@ -293,6 +576,15 @@ class VelocityCalculator:
         tech_list = ACTIVE_LISTS[list_name]
         velocities = []
 
+        # Batch the GitHub velocity arithmetic over the whole list: the
+        # latest/oldest files are loaded once and the growth rates are
+        # computed with one vectorized pass per metric
+        by_source = tech_list.get('by_source', {})
+        github_techs = by_source.get('github') \
+            or [t for t in tech_list['technologies'] if 'github' in t]
+        github_names = [tech['name'] for tech in github_techs]
+        github_velocities = self._batch_github_velocities(list_name, github_names)
+
         for tech in tech_list['technologies']:
             tech_name = tech['name']
             logger.info(f"\nAnalyzing {tech_name}...")
@@ -305,7 +597,7 @@ class VelocityCalculator:
 
             # GitHub velocity
             if 'github' in tech:
-                github_vel = self.calculate_github_velocity(tech_name, list_name)
+                github_vel = github_velocities[tech_name]
                 tech_velocity['github'] = github_vel
                 if 'error' not in github_vel:
                     logger.info(f"  GitHub momentum: {github_vel.get('momentum_score', 0):.1f}%")
@@ -350,8 +642,7 @@ def calculate_all_velocities() -> Dict[str, Dict]:
 
         # Save individual report
         output_file = PROCESSED_DATA_DIR / f'velocity_{list_name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        dump_json(report, output_file)
         logger.info(f"\nSaved velocity report to {output_file}")
 
     return results
@@ -4,6 +4,7 @@ Orchestrates collection from all sources (GitHub, npm, PyPI)
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path
@@ -34,38 +35,30 @@ def collect_all_data(list_name: str = None):
     else:
         logger.info("Collecting data for: ALL lists (Enterprise AI + Fintech AI)")
 
-    # Collect from GitHub
-    try:
-        logger.info("\n" + "="*70)
-        logger.info("PHASE 1: GitHub Data Collection")
-        logger.info("="*70)
-        github_results = collect_github_data(list_name)
-        logger.info(f"✓ GitHub collection completed")
-    except Exception as e:
-        logger.error(f"✗ GitHub collection failed: {e}")
-        github_results = {}
-
-    # Collect from npm
-    try:
-        logger.info("\n" + "="*70)
-        logger.info("PHASE 2: npm Data Collection")
-        logger.info("="*70)
-        npm_results = collect_npm_data(list_name)
-        logger.info(f"✓ npm collection completed")
-    except Exception as e:
-        logger.error(f"✗ npm collection failed: {e}")
-        npm_results = {}
-
-    # Collect from PyPI
-    try:
-        logger.info("\n" + "="*70)
-        logger.info("PHASE 3: PyPI Data Collection")
-        logger.info("="*70)
-        pypi_results = collect_pypi_data(list_name)
-        logger.info(f"✓ PyPI collection completed")
-    except Exception as e:
-        logger.error(f"✗ PyPI collection failed: {e}")
-        pypi_results = {}
+    def _collect_source(source_name: str, collect_fn):
+        """Run one source's collection, logging success or failure"""
+        try:
+            logger.info("\n" + "="*70)
+            logger.info(f"COLLECTING: {source_name} data")
+            logger.info("="*70)
+            results = collect_fn(list_name)
+            logger.info(f"✓ {source_name} collection completed")
+            return results
+        except Exception as e:
+            logger.error(f"✗ {source_name} collection failed: {e}")
+            return {}
+
+    # The three sources hit independent APIs with independent rate
+    # limits, so collect them concurrently; total wall-clock becomes
+    # roughly the slowest source instead of the sum of all three
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        github_future = executor.submit(_collect_source, 'GitHub', collect_github_data)
+        npm_future = executor.submit(_collect_source, 'npm', collect_npm_data)
+        pypi_future = executor.submit(_collect_source, 'PyPI', collect_pypi_data)
+
+        github_results = github_future.result()
+        npm_results = npm_future.result()
+        pypi_results = pypi_future.result()
 
     # Summary
     logger.info("\n" + "="*70)
@@ -3,18 +3,84 @@ GitHub API Data Collector
 Fetches repository metrics: stars, forks, commits, issues
 """
 
-import requests
+import httpx
+import os
+import threading
 import time
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..utils.config import GITHUB_TOKEN, GITHUB_DELAY, RAW_DATA_DIR
+from ..utils.jsonio import append_ndjson, dump_json, load_json, load_ndjson
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# One GraphQL request returns what the REST path needs three calls for
+# (repo info, commit history count, contributor count)
+_REPO_METRICS_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    stargazerCount
+    forkCount
+    diskUsage
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    createdAt
+    updatedAt
+    pushedAt
+    homepageUrl
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    defaultBranchRef {
+      target { ... on Commit { history(since: $since) { totalCount } } }
+    }
+    mentionableUsers { totalCount }
+  }
+}
+"""
+
+
+def _seed_collection_index(output_dir: Path) -> None:
+    """
+    Backfill the per-list index with data files it does not list yet
+
+    Analysis passes trust _index.ndjson outright once it exists, so the
+    first indexed collection in a directory holding pre-index history
+    must fold the older files in — otherwise they vanish from every
+    velocity baseline. Also repairs an index that missed files (e.g.
+    one written before this seeding existed). Runs once per collection,
+    where a directory scan is noise next to the network time.
+    """
+    index_path = output_dir / '_index.ndjson'
+    known = set()
+    if index_path.exists():
+        try:
+            known = {e['path'] for e in load_ndjson(index_path) if 'path' in e}
+        except Exception as e:
+            logger.warning(f"Could not read collection index {index_path}: {e}")
+            return
+
+    with os.scandir(output_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name in known or not name.endswith('.json'):
+                continue
+            source, _, rest = name.partition('_')
+            if source not in ('github', 'npm', 'pypi'):
+                continue
+            timestamp = rest[:-5]
+            # Same filename screen the analyzers apply
+            if len(timestamp) != 15 or not timestamp.replace('_', '').isdigit():
+                continue
+            append_ndjson({'source': source, 'timestamp': timestamp,
+                           'path': name}, index_path)
+
 
 class GitHubCollector:
     """Collects data from GitHub API for repository metrics"""
@@ -31,14 +97,53 @@ class GitHubCollector:
             logger.warning("No GitHub token provided. Rate limits will be strict (60/hour).")
 
         self.base_url = "https://api.github.com"
+        self.gql_url = "https://api.github.com/graphql"
         self.headers = {
             "Accept": "application/vnd.github.v3+json"
         }
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
 
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        # HTTP/2 client: concurrent API calls multiplex over one
+        # keep-alive TLS connection instead of handshaking per worker
+        self.client = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+
+        # Shared rate gate: workers space requests GITHUB_DELAY apart
+        # collectively instead of each sleeping on its own
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # ETag cache: conditional GETs turn unchanged responses into
+        # 304s, which carry no body and don't count against the
+        # primary rate limit. Persisted across runs next to the raw
+        # data, storing the last body so 304s can be answered locally.
+        self._etag_lock = threading.Lock()
+        self._etag_cache_path = RAW_DATA_DIR / '.etag_cache.json'
+        try:
+            self.etag_cache = load_json(self._etag_cache_path)
+        except Exception:
+            self.etag_cache = {}
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache for the next run"""
+        try:
+            dump_json(self.etag_cache, self._etag_cache_path, indent=False)
+        except Exception as e:
+            logger.warning(f"Could not save ETag cache: {e}")
+
+    def _throttle(self) -> None:
+        """Reserve the next request slot and sleep until it arrives"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + GITHUB_DELAY
+        if wait > 0:
+            time.sleep(wait)
 
     def _make_request(self, url: str, params: dict = None) -> Optional[dict]:
         """
@@ -51,9 +156,16 @@ class GitHubCollector:
         Returns:
             JSON response or None if failed
         """
+        cached = self.etag_cache.get(url)
+        request_headers = {'If-None-Match': cached['etag']} if cached else None
+
         try:
-            time.sleep(GITHUB_DELAY)  # Rate limiting
-            response = self.session.get(url, params=params)
+            self._throttle()  # Rate limiting, shared across workers
+            response = self.client.get(url, params=params, headers=request_headers)
+
+            if response.status_code == 304:
+                logger.debug(f"Not modified, using cached response: {url}")
+                return cached['data']
 
             # Check rate limit
             remaining = response.headers.get('X-RateLimit-Remaining')
@@ -61,21 +173,46 @@ class GitHubCollector:
                 logger.debug(f"GitHub API rate limit remaining: {remaining}")
 
             response.raise_for_status()
-            return response.json()
+            data = response.json()
 
-        except requests.exceptions.HTTPError as e:
+            etag = response.headers.get('ETag')
+            if etag:
+                with self._etag_lock:
+                    self.etag_cache[url] = {'etag': etag, 'data': data}
+
+            return data
+
+        except httpx.HTTPStatusError as e:
             if response.status_code == 404:
                 logger.warning(f"Repository not found: {url}")
             elif response.status_code == 403:
+                # If the primary rate limit is exhausted, wait for the
+                # reset instead of failing the repo outright
+                reset = response.headers.get('X-RateLimit-Reset')
+                if response.headers.get('X-RateLimit-Remaining') == '0' and reset:
+                    wait = max(0.0, int(reset) - time.time()) + 1
+                    logger.warning(f"Rate limit exhausted; sleeping {wait:.0f}s until reset")
+                    time.sleep(wait)
+                    return self._make_request(url, params)
                 logger.error(f"Rate limit exceeded or forbidden: {url}")
             else:
                 logger.error(f"HTTP error fetching {url}: {e}")
             return None
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error fetching {url}: {e}")
             return None
 
+    def close(self) -> None:
+        """Close the underlying HTTP client"""
+        self.client.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def get_repo_info(self, repo_path: str) -> Optional[Dict]:
         """
         Get basic repository information
@@ -156,6 +293,76 @@ class GitHubCollector:
             'top_contributor_commits': data[0].get('contributions', 0) if data else 0,
         }
 
+    def _graphql_repo_metrics(self, repo_path: str) -> Optional[Dict]:
+        """
+        Fetch repo info, commit count and contributor count in one
+        GraphQL request
+
+        Args:
+            repo_path: Repository path (e.g., 'owner/repo')
+
+        Returns:
+            Metrics fields matching the REST path, or None on failure
+        """
+        if not self.token or '/' not in repo_path:
+            return None
+
+        owner, name = repo_path.split('/', 1)
+        since = (datetime.now() - timedelta(days=365)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        try:
+            self._throttle()
+            response = self.client.post(self.gql_url, json={
+                'query': _REPO_METRICS_QUERY,
+                'variables': {'owner': owner, 'name': name, 'since': since},
+            })
+            response.raise_for_status()
+            payload = response.json()
+        except httpx.HTTPError as e:
+            logger.warning(f"GraphQL request failed for {repo_path}: {e}")
+            return None
+
+        if payload.get('errors') or not payload.get('data', {}).get('repository'):
+            logger.warning(f"GraphQL returned no repository for {repo_path}")
+            return None
+
+        repo = payload['data']['repository']
+        branch_ref = repo.get('defaultBranchRef') or {}
+        history = (branch_ref.get('target') or {}).get('history') or {}
+        topics = repo.get('repositoryTopics') or {}
+
+        return {
+            'name': repo.get('name'),
+            'full_name': repo.get('nameWithOwner'),
+            'description': repo.get('description'),
+            'stars': repo.get('stargazerCount'),
+            'forks': repo.get('forkCount'),
+            # REST's open_issues_count includes open pull requests, so
+            # sum both counts to keep the stored field comparable across
+            # snapshots collected with and without a token
+            'open_issues': ((repo.get('issues') or {}).get('totalCount', 0)
+                            + (repo.get('pullRequests') or {}).get('totalCount', 0)),
+            # REST's watchers_count equals the stargazer count (the
+            # subscriber count GraphQL exposes as watchers is ~100x
+            # smaller), so mirror REST to keep snapshots comparable
+            'watchers': repo.get('stargazerCount'),
+            'size': repo.get('diskUsage'),
+            'language': (repo.get('primaryLanguage') or {}).get('name'),
+            'created_at': repo.get('createdAt'),
+            'updated_at': repo.get('updatedAt'),
+            'pushed_at': repo.get('pushedAt'),
+            'homepage': repo.get('homepageUrl'),
+            'topics': [n['topic']['name'] for n in topics.get('nodes', []) if n.get('topic')],
+            'commit_activity': {
+                'total_commits_last_year': history.get('totalCount', 0),
+                'weekly_activity': [],
+            },
+            'contributors': {
+                'total_contributors': (repo.get('mentionableUsers') or {}).get('totalCount', 0),
+                'top_contributor_commits': 0,
+            },
+        }
+
     def collect_repo_metrics(self, repo_path: str, tech_name: str) -> Dict:
         """
         Collect all metrics for a repository
@@ -176,6 +383,13 @@ class GitHubCollector:
             'source': 'github',
         }
 
+        # One GraphQL round-trip covers everything the three REST
+        # calls fetch; fall back to REST when it is unavailable
+        gql_metrics = self._graphql_repo_metrics(repo_path)
+        if gql_metrics:
+            metrics.update(gql_metrics)
+            return metrics
+
         # Get basic info
         repo_info = self.get_repo_info(repo_path)
         if repo_info:
@@ -213,28 +427,60 @@ class GitHubCollector:
             List of metrics dictionaries
         """
         logger.info(f"Starting GitHub collection for {list_name}")
-        all_metrics = []
-
-        for tech in tech_list['technologies']:
-            if 'github' not in tech:
-                logger.info(f"Skipping {tech['name']} - no GitHub repository")
-                continue
 
-            metrics = self.collect_repo_metrics(
-                repo_path=tech['github'],
-                tech_name=tech['name']
-            )
-            all_metrics.append(metrics)
+        github_techs = tech_list.get('by_source', {}).get('github') \
+            or [t for t in tech_list['technologies'] if 'github' in t]
+        pairs = [(tech['github'], tech['name']) for tech in github_techs]
 
-        # Save to file
         output_dir = RAW_DATA_DIR / list_name
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Fold any pre-index files into the index before this run's
+        # entry is appended (the new output file is not on disk yet,
+        # so the seeding scan cannot double-count it)
+        _seed_collection_index(output_dir)
+
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        journal_file = output_dir / f'github_{timestamp}.ndjson'
+
+        # Collection is dominated by network latency, so fan the repos
+        # out over a thread pool; the shared rate gate keeps the
+        # combined request rate within the GITHUB_DELAY budget. Each
+        # record is journaled to NDJSON as it completes, so a crashed
+        # run keeps everything collected so far.
+        all_metrics: List[Optional[Dict]] = [None] * len(pairs)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(self.collect_repo_metrics, repo_path, name): i
+                       for i, (repo_path, name) in enumerate(pairs)}
+            for future in as_completed(futures):
+                record = future.result()
+                all_metrics[futures[future]] = record
+                append_ndjson(record, journal_file)
+
+        # Save to file (submission order, same shape as before)
         output_file = output_dir / f'github_{timestamp}.json'
-
-        with open(output_file, 'w') as f:
-            json.dump(all_metrics, f, indent=2)
+        dump_json(all_metrics, output_file, compress=True)
+
+        # Also write a slim companion holding only the scalar fields
+        # the velocity calculator reads, so analysis never has to parse
+        # the weekly_activity/topics payloads. The '-' in the prefix
+        # keeps it out of the github_* listings.
+        slim_fields = ('technology', 'collected_at', 'stars', 'forks',
+                       'watchers', 'open_issues', 'error')
+        slim_metrics = [{k: m[k] for k in slim_fields if k in m} for m in all_metrics]
+        dump_json(slim_metrics, output_dir / f'github-slim_{timestamp}.json', indent=False)
+
+        # The canonical files are safely written; drop the journal
+        journal_file.unlink(missing_ok=True)
+
+        # Record the new file in the per-list collection index so
+        # analysis passes can discover files without scanning the
+        # directory
+        append_ndjson({'source': 'github', 'timestamp': timestamp,
+                       'path': output_file.name},
+                      output_dir / '_index.ndjson')
+
+        self._save_etag_cache()
 
         logger.info(f"Saved GitHub data to {output_file}")
         logger.info(f"Collected {len(all_metrics)} repositories for {list_name}")
@@ -3,17 +3,26 @@ npm API Data Collector
 Fetches package download statistics from npm registry
 """
 
-import requests
-import json
+import asyncio
+import copy
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import httpx
+import numpy as np
+
 from ..utils.config import RAW_DATA_DIR
+from ..utils.httpcache import ResponseCache
+from ..utils.jsonio import dump_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# Cap on simultaneous in-flight requests; keeps us well under npm's
+# rate limits while still overlapping all the network waits
+MAX_CONCURRENT_REQUESTS = 10
+
 
 class NpmCollector:
     """Collects download statistics from npm registry"""
@@ -22,46 +31,66 @@ class NpmCollector:
         """Initialize npm collector"""
         self.registry_url = "https://registry.npmjs.org"
         self.downloads_url = "https://api.npmjs.org/downloads"
-        self.session = requests.Session()
+        self.cache = ResponseCache(RAW_DATA_DIR / '.npm_http_cache.json')
+        # Per-run memo of finished package metrics, keyed by package name
+        self._metrics_cache: Dict[str, Dict] = {}
 
-    def _make_request(self, url: str) -> Optional[dict]:
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> Optional[dict]:
         """
         Make request to npm API with error handling
 
         Args:
+            client: Shared httpx async client
             url: API endpoint URL
 
         Returns:
             JSON response or None if failed
         """
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+
+        # Revalidate an expired entry instead of refetching the body;
+        # the registry answers unchanged resources with a bodyless 304
+        headers = {}
+        etag = self.cache.get_etag(url)
+        if etag:
+            headers['If-None-Match'] = etag
 
-        except requests.exceptions.HTTPError as e:
+        try:
+            response = await client.get(url, headers=headers)
+            if response.status_code == 304:
+                return self.cache.refresh(url)
             if response.status_code == 404:
                 logger.warning(f"Package not found: {url}")
-            else:
-                logger.error(f"HTTP error fetching {url}: {e}")
+                return None
+            response.raise_for_status()
+            data = response.json()
+            self.cache.set(url, data, response.headers.get('ETag'))
+            return data
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error fetching {url}: {e}")
             return None
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Request error fetching {url}: {e}")
             return None
 
-    def get_package_info(self, package_name: str) -> Optional[Dict]:
+    async def get_package_info(self, client: httpx.AsyncClient,
+                               package_name: str) -> Optional[Dict]:
         """
         Get package metadata from npm registry
 
         Args:
+            client: Shared httpx async client
             package_name: npm package name
 
         Returns:
             Package metadata or None
         """
         url = f"{self.registry_url}/{package_name}"
-        data = self._make_request(url)
+        data = await self._fetch(client, url)
 
         if not data:
             return None
@@ -82,11 +111,13 @@ class NpmCollector:
             'modified': data.get('time', {}).get('modified'),
         }
 
-    def get_download_stats(self, package_name: str, period: str = 'last-month') -> Optional[Dict]:
+    async def get_download_stats(self, client: httpx.AsyncClient, package_name: str,
+                                 period: str = 'last-month') -> Optional[Dict]:
         """
         Get download statistics for a package
 
         Args:
+            client: Shared httpx async client
             package_name: npm package name
             period: Time period ('last-day', 'last-week', 'last-month', 'last-year')
 
@@ -94,7 +125,7 @@ class NpmCollector:
             Download statistics or None
         """
         url = f"{self.downloads_url}/point/{period}/{package_name}"
-        data = self._make_request(url)
+        data = await self._fetch(client, url)
 
         if not data:
             return None
@@ -106,11 +137,13 @@ class NpmCollector:
             'period': period
         }
 
-    def get_download_range(self, package_name: str, days: int = 30) -> Optional[Dict]:
+    async def get_download_range(self, client: httpx.AsyncClient, package_name: str,
+                                 days: int = 30) -> Optional[Dict]:
         """
         Get download statistics for a date range
 
         Args:
+            client: Shared httpx async client
             package_name: npm package name
             days: Number of days to look back
 
@@ -124,13 +157,15 @@ class NpmCollector:
         end_str = end_date.strftime('%Y-%m-%d')
 
         url = f"{self.downloads_url}/range/{start_str}:{end_str}/{package_name}"
-        data = self._make_request(url)
+        data = await self._fetch(client, url)
 
         if not data:
             return None
 
         downloads = data.get('downloads', [])
-        total = sum(day.get('downloads', 0) for day in downloads)
+        counts = np.fromiter((day.get('downloads', 0) for day in downloads),
+                             dtype=np.int64, count=len(downloads))
+        total = int(counts.sum())
 
         return {
             'total_downloads': total,
@@ -138,75 +173,103 @@ class NpmCollector:
             'end_date': end_str,
             'days': days,
             'daily_average': total / days if days > 0 else 0,
-            'daily_data': downloads
+            # Per-day counts only; the per-entry date dicts roughly double
+            # the stored size and nothing downstream reads them
+            'daily_data': counts.tolist()
         }
 
-    def collect_package_metrics(self, package_name: str, tech_name: str) -> Dict:
+    async def collect_package_metrics(self, semaphore: asyncio.Semaphore,
+                                      client: httpx.AsyncClient,
+                                      package_name: str, tech_name: str) -> Dict:
         """
         Collect all metrics for an npm package
 
         Args:
+            semaphore: Concurrency cap shared across the whole list
+            client: Shared httpx async client
             package_name: npm package name
             tech_name: Technology name for logging
 
         Returns:
             Complete metrics dictionary
         """
-        logger.info(f"Collecting npm data for {tech_name} ({package_name})")
-
-        metrics = {
-            'technology': tech_name,
-            'package': package_name,
-            'collected_at': datetime.now().isoformat(),
-            'source': 'npm',
-        }
-
-        # Get package info
-        package_info = self.get_package_info(package_name)
-        if package_info:
-            metrics.update(package_info)
-        else:
-            logger.warning(f"Failed to get package info for {tech_name}")
-            metrics['error'] = 'Package not found or API error'
+        async with semaphore:
+            # A package shared by several lists (common for core infra) is
+            # fetched once per run; later lists get a relabelled copy
+            cached = self._metrics_cache.get(package_name)
+            if cached is not None:
+                metrics = copy.deepcopy(cached)
+                metrics['technology'] = tech_name
+                return metrics
+
+            logger.info(f"Collecting npm data for {tech_name} ({package_name})")
+
+            metrics = {
+                'technology': tech_name,
+                'package': package_name,
+                'collected_at': datetime.now().isoformat(),
+                'source': 'npm',
+            }
+
+            # Get package info
+            package_info = await self.get_package_info(client, package_name)
+            if package_info:
+                metrics.update(package_info)
+            else:
+                logger.warning(f"Failed to get package info for {tech_name}")
+                metrics['error'] = 'Package not found or API error'
+                return metrics
+
+            # Get download stats for different periods
+            for period in ['last-week', 'last-month']:
+                stats = await self.get_download_stats(client, package_name, period)
+                if stats:
+                    metrics[f'downloads_{period.replace("-", "_")}'] = stats['downloads']
+
+            # Get detailed 30-day range
+            range_stats = await self.get_download_range(client, package_name, days=30)
+            if range_stats:
+                metrics['downloads_30_day'] = range_stats
+
+            self._metrics_cache[package_name] = metrics
             return metrics
 
-        # Get download stats for different periods
-        for period in ['last-week', 'last-month']:
-            stats = self.get_download_stats(package_name, period)
-            if stats:
-                metrics[f'downloads_{period.replace("-", "_")}'] = stats['downloads']
-
-        # Get detailed 30-day range
-        range_stats = self.get_download_range(package_name, days=30)
-        if range_stats:
-            metrics['downloads_30_day'] = range_stats
-
-        return metrics
-
-    def collect_for_list(self, tech_list: Dict, list_name: str) -> List[Dict]:
+    def _new_client(self) -> httpx.AsyncClient:
+        """Build the HTTP/2 client with keep-alive tuned for reuse"""
+        # HTTP/2 multiplexes every package fetch over one TLS connection,
+        # so only the first request pays the handshake cost; the long
+        # keepalive_expiry keeps sockets warm between lists
+        limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS,
+                              max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                              keepalive_expiry=60.0)
+        return httpx.AsyncClient(http2=True, timeout=10.0, limits=limits)
+
+    async def collect_for_list_async(self, tech_list: Dict, list_name: str,
+                                     client: httpx.AsyncClient) -> List[Dict]:
         """
         Collect npm data for all technologies in a list
 
         Args:
             tech_list: Technology list dictionary
             list_name: Name of the list (for file naming)
+            client: Shared httpx async client
 
         Returns:
-            List of metrics dictionaries
+            List of metrics dictionaries, in input order
         """
         logger.info(f"Starting npm collection for {list_name}")
-        all_metrics = []
 
-        for tech in tech_list['technologies']:
-            if 'npm' not in tech:
-                logger.info(f"Skipping {tech['name']} - no npm package")
-                continue
+        npm_techs = tech_list.get('by_source', {}).get('npm')
+        if npm_techs is None:
+            npm_techs = [tech for tech in tech_list['technologies'] if 'npm' in tech]
 
-            metrics = self.collect_package_metrics(
-                package_name=tech['npm'],
-                tech_name=tech['name']
-            )
-            all_metrics.append(metrics)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        tasks = [
+            self.collect_package_metrics(semaphore, client, tech['npm'], tech['name'])
+            for tech in npm_techs
+        ]
+        all_metrics = await asyncio.gather(*tasks)
+        self.cache.save()
 
         # Save to file
         output_dir = RAW_DATA_DIR / list_name
@@ -215,14 +278,39 @@ class NpmCollector:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = output_dir / f'npm_{timestamp}.json'
 
-        with open(output_file, 'w') as f:
-            json.dump(all_metrics, f, indent=2)
+        dump_json(all_metrics, output_file, compress=True)
+
+        # Also write a slim companion holding only the scalar fields the
+        # velocity calculator reads, so analysis never has to parse the
+        # package metadata or daily series. The '-' in the prefix keeps
+        # it out of the npm_* listings.
+        slim_fields = ('technology', 'collected_at', 'downloads_last_week',
+                       'downloads_last_month', 'error')
+        slim_metrics = [{k: m[k] for k in slim_fields if k in m} for m in all_metrics]
+        dump_json(slim_metrics, output_dir / f'npm-slim_{timestamp}.json', indent=False)
 
         logger.info(f"Saved npm data to {output_file}")
         logger.info(f"Collected {len(all_metrics)} packages for {list_name}")
 
         return all_metrics
 
+    def collect_for_list(self, tech_list: Dict, list_name: str) -> List[Dict]:
+        """
+        Collect npm data for a single list with a dedicated client
+
+        Args:
+            tech_list: Technology list dictionary
+            list_name: Name of the list (for file naming)
+
+        Returns:
+            List of metrics dictionaries
+        """
+        async def _run():
+            async with self._new_client() as client:
+                return await self.collect_for_list_async(tech_list, list_name, client)
+
+        return asyncio.run(_run())
+
 
 def collect_npm_data(list_name: str = None) -> Dict[str, List[Dict]]:
     """
@@ -238,19 +326,24 @@ def collect_npm_data(list_name: str = None) -> Dict[str, List[Dict]]:
     from ..utils.config import ACTIVE_LISTS
 
     collector = NpmCollector()
-    results = {}
 
     lists_to_process = {list_name: ACTIVE_LISTS[list_name]} if list_name else ACTIVE_LISTS
 
-    for name, tech_list in lists_to_process.items():
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing {name.upper()} list")
-        logger.info(f"{'='*60}")
-
-        metrics = collector.collect_for_list(tech_list, name)
-        results[name] = metrics
-
-    return results
+    # One client (and thus one warm connection pool) for every list in
+    # the run, so the second list skips DNS and TLS setup entirely
+    async def _collect_all():
+        results = {}
+        async with collector._new_client() as client:
+            for name, tech_list in lists_to_process.items():
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Processing {name.upper()} list")
+                logger.info(f"{'='*60}")
+
+                results[name] = await collector.collect_for_list_async(
+                    tech_list, name, client)
+        return results
+
+    return asyncio.run(_collect_all())
 
 
 if __name__ == "__main__":
@@ -3,18 +3,55 @@ PyPI Data Collector
 Fetches package download statistics and metadata from Python Package Index
 """
 
-import requests
-import json
+import asyncio
+import copy
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 import time
 
+import httpx
+
 from ..utils.config import RAW_DATA_DIR
+from ..utils.httpcache import ResponseCache
+from ..utils.jsonio import dump_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
+# Cap on simultaneous in-flight requests; pypistats.org rate-limits
+# aggressively, so stay modest while still overlapping network waits
+MAX_CONCURRENT_REQUESTS = 5
+
+
+class _AsyncRateGate:
+    """
+    Token-bucket rate limiter for async requests
+
+    Allows bursts up to `burst` requests, refilling at `rate` tokens per
+    second, so short runs proceed at full speed while sustained load
+    stays under the API's cap. Cached responses never consume a token.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: int = 5):
+        self.rate = rate
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Take one token, sleeping until the bucket refills if empty"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
 
 class PyPICollector:
     """Collects download statistics and metadata from PyPI"""
@@ -23,60 +60,84 @@ class PyPICollector:
         """Initialize PyPI collector"""
         self.pypi_url = "https://pypi.org/pypi"
         self.pypistats_url = "https://pypistats.org/api"
-        self.session = requests.Session()
+        self.cache = ResponseCache(RAW_DATA_DIR / '.pypi_http_cache.json')
+        self._rate_gate = _AsyncRateGate(rate=5.0, burst=5)
+        # Per-run memo of finished package metrics, keyed by package name
+        self._metrics_cache: Dict[str, Dict] = {}
 
-    def _make_request(self, url: str, retry_count: int = 3) -> Optional[dict]:
+    async def _make_request(self, client: httpx.AsyncClient, url: str,
+                            retry_count: int = 3) -> Optional[dict]:
         """
         Make request to PyPI API with error handling and retries
 
         Args:
+            client: Shared httpx async client
             url: API endpoint URL
             retry_count: Number of retries on failure
 
         Returns:
             JSON response or None if failed
         """
+        cached = self.cache.get(url)
+        if cached is not None:
+            return cached
+
+        # Revalidate an expired entry instead of refetching the body;
+        # pypi.org answers unchanged resources with a bodyless 304
+        headers = {}
+        etag = self.cache.get_etag(url)
+        if etag:
+            headers['If-None-Match'] = etag
+
         for attempt in range(retry_count):
             try:
-                response = self.session.get(url, timeout=15)
+                await self._rate_gate.acquire()
+                response = await client.get(url, headers=headers)
+                if response.status_code == 304:
+                    return self.cache.refresh(url)
                 response.raise_for_status()
-                return response.json()
+                data = response.json()
+                self.cache.set(url, data, response.headers.get('ETag'))
+                return data
 
-            except requests.exceptions.HTTPError as e:
-                if response.status_code == 404:
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                if status_code == 404:
                     logger.warning(f"Package not found: {url}")
                     return None
-                elif response.status_code == 429:
+                elif status_code == 429:
                     # Rate limited, wait and retry
                     wait_time = 2 ** attempt  # Exponential backoff
                     logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
                 else:
                     logger.error(f"HTTP error fetching {url}: {e}")
                     return None
 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 logger.error(f"Request error fetching {url}: {e}")
                 if attempt < retry_count - 1:
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     continue
                 return None
 
         return None
 
-    def get_package_info(self, package_name: str) -> Optional[Dict]:
+    async def get_package_info(self, client: httpx.AsyncClient,
+                               package_name: str) -> Optional[Dict]:
         """
         Get package metadata from PyPI
 
         Args:
+            client: Shared httpx async client
             package_name: PyPI package name
 
         Returns:
             Package metadata or None
         """
         url = f"{self.pypi_url}/{package_name}/json"
-        data = self._make_request(url)
+        data = await self._make_request(client, url)
 
         if not data:
             return None
@@ -97,18 +158,20 @@ class PyPICollector:
             'classifiers': info.get('classifiers', []),
         }
 
-    def get_download_stats_recent(self, package_name: str) -> Optional[Dict]:
+    async def get_download_stats_recent(self, client: httpx.AsyncClient,
+                                        package_name: str) -> Optional[Dict]:
         """
         Get recent download statistics from pypistats.org
 
         Args:
+            client: Shared httpx async client
             package_name: PyPI package name
 
         Returns:
             Download statistics or None
         """
         url = f"{self.pypistats_url}/packages/{package_name}/recent"
-        data = self._make_request(url)
+        data = await self._make_request(client, url)
 
         if not data or 'data' not in data:
             return None
@@ -121,109 +184,129 @@ class PyPICollector:
             'last_month': stats.get('last_month', 0),
         }
 
-    def get_download_stats_overall(self, package_name: str) -> Optional[Dict]:
+    async def get_download_stats_overall(self, client: httpx.AsyncClient,
+                                         package_name: str) -> Optional[Dict]:
         """
         Get overall download statistics
 
         Args:
+            client: Shared httpx async client
             package_name: PyPI package name
 
         Returns:
             Download statistics or None
         """
-        url = f"{self.pypistats_url}/packages/{package_name}/overall"
-        data = self._make_request(url)
+        # The /overall endpoint returns the package's entire historical
+        # series (often MBs) only to be truncated to the last 30 points.
+        # /recent?period=month answers the same question with a single
+        # integer and a <1 KB payload
+        url = f"{self.pypistats_url}/packages/{package_name}/recent?period=month"
+        data = await self._make_request(client, url)
 
         if not data or 'data' not in data:
             return None
 
-        # Calculate totals from the data
-        downloads_data = data.get('data', [])
-        if not downloads_data:
-            return None
-
-        # Get recent data points (last 30 days)
-        recent_data = downloads_data[-30:] if len(downloads_data) >= 30 else downloads_data
-        total_recent = sum(item.get('downloads', 0) for item in recent_data)
+        total_recent = data['data'].get('last_month', 0)
 
         return {
             'total_downloads_30_day': total_recent,
-            'average_daily': total_recent / len(recent_data) if recent_data else 0,
-            'data_points': len(downloads_data),
+            'average_daily': total_recent / 30,
         }
 
-    def collect_package_metrics(self, package_name: str, tech_name: str) -> Dict:
+    async def collect_package_metrics(self, semaphore: asyncio.Semaphore,
+                                      client: httpx.AsyncClient,
+                                      package_name: str, tech_name: str) -> Dict:
         """
         Collect all metrics for a PyPI package
 
         Args:
+            semaphore: Concurrency cap shared across the whole list
+            client: Shared httpx async client
             package_name: PyPI package name
             tech_name: Technology name for logging
 
         Returns:
             Complete metrics dictionary
         """
-        logger.info(f"Collecting PyPI data for {tech_name} ({package_name})")
-
-        metrics = {
-            'technology': tech_name,
-            'package': package_name,
-            'collected_at': datetime.now().isoformat(),
-            'source': 'pypi',
-        }
-
-        # Get package info
-        package_info = self.get_package_info(package_name)
-        if package_info:
-            metrics.update(package_info)
-        else:
-            logger.warning(f"Failed to get package info for {tech_name}")
-            metrics['error'] = 'Package not found or API error'
+        async with semaphore:
+            # A package shared by several lists (common for core infra) is
+            # fetched once per run; later lists get a relabelled copy
+            cached = self._metrics_cache.get(package_name)
+            if cached is not None:
+                metrics = copy.deepcopy(cached)
+                metrics['technology'] = tech_name
+                return metrics
+
+            logger.info(f"Collecting PyPI data for {tech_name} ({package_name})")
+
+            metrics = {
+                'technology': tech_name,
+                'package': package_name,
+                'collected_at': datetime.now().isoformat(),
+                'source': 'pypi',
+            }
+
+            # Get package info
+            package_info = await self.get_package_info(client, package_name)
+            if package_info:
+                metrics.update(package_info)
+            else:
+                logger.warning(f"Failed to get package info for {tech_name}")
+                metrics['error'] = 'Package not found or API error'
+                return metrics
+
+            # Get recent download stats
+            recent_stats = await self.get_download_stats_recent(client, package_name)
+            if recent_stats:
+                metrics['downloads_recent'] = recent_stats
+            else:
+                logger.warning(f"Failed to get recent download stats for {tech_name}")
+
+            # Get overall download stats
+            overall_stats = await self.get_download_stats_overall(client, package_name)
+            if overall_stats:
+                metrics['downloads_overall'] = overall_stats
+            else:
+                logger.warning(f"Failed to get overall download stats for {tech_name}")
+
+            self._metrics_cache[package_name] = metrics
             return metrics
 
-        # Get recent download stats
-        recent_stats = self.get_download_stats_recent(package_name)
-        if recent_stats:
-            metrics['downloads_recent'] = recent_stats
-        else:
-            logger.warning(f"Failed to get recent download stats for {tech_name}")
-
-        # Get overall download stats
-        overall_stats = self.get_download_stats_overall(package_name)
-        if overall_stats:
-            metrics['downloads_overall'] = overall_stats
-        else:
-            logger.warning(f"Failed to get overall download stats for {tech_name}")
-
-        # Small delay to be respectful to API
-        time.sleep(0.5)
-
-        return metrics
-
-    def collect_for_list(self, tech_list: Dict, list_name: str) -> List[Dict]:
+    def _new_client(self) -> httpx.AsyncClient:
+        """Build the HTTP/2 client with keep-alive tuned for reuse"""
+        # HTTP/2 multiplexes every package fetch over one TLS connection,
+        # so only the first request pays the handshake cost; the long
+        # keepalive_expiry keeps sockets warm between lists
+        limits = httpx.Limits(max_connections=MAX_CONCURRENT_REQUESTS,
+                              max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                              keepalive_expiry=60.0)
+        return httpx.AsyncClient(http2=True, timeout=15.0, limits=limits)
+
+    async def collect_for_list_async(self, tech_list: Dict, list_name: str,
+                                     client: httpx.AsyncClient) -> List[Dict]:
         """
         Collect PyPI data for all technologies in a list
 
         Args:
             tech_list: Technology list dictionary
             list_name: Name of the list (for file naming)
+            client: Shared httpx async client
 
         Returns:
-            List of metrics dictionaries
+            List of metrics dictionaries, in input order
         """
         logger.info(f"Starting PyPI collection for {list_name}")
-        all_metrics = []
 
-        for tech in tech_list['technologies']:
-            if 'pypi' not in tech:
-                logger.info(f"Skipping {tech['name']} - no PyPI package")
-                continue
+        pypi_techs = tech_list.get('by_source', {}).get('pypi')
+        if pypi_techs is None:
+            pypi_techs = [tech for tech in tech_list['technologies'] if 'pypi' in tech]
 
-            metrics = self.collect_package_metrics(
-                package_name=tech['pypi'],
-                tech_name=tech['name']
-            )
-            all_metrics.append(metrics)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        tasks = [
+            self.collect_package_metrics(semaphore, client, tech['pypi'], tech['name'])
+            for tech in pypi_techs
+        ]
+        all_metrics = await asyncio.gather(*tasks)
 
         # Save to file
         output_dir = RAW_DATA_DIR / list_name
@@ -232,14 +315,39 @@ class PyPICollector:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_file = output_dir / f'pypi_{timestamp}.json'
 
-        with open(output_file, 'w') as f:
-            json.dump(all_metrics, f, indent=2)
+        dump_json(all_metrics, output_file, compress=True)
 
+        # Also write a slim companion holding only the fields the
+        # velocity calculator reads, so analysis never has to parse the
+        # package metadata or classifier lists. The '-' in the prefix
+        # keeps it out of the pypi_* listings.
+        slim_fields = ('technology', 'collected_at', 'downloads_recent', 'error')
+        slim_metrics = [{k: m[k] for k in slim_fields if k in m} for m in all_metrics]
+        dump_json(slim_metrics, output_dir / f'pypi-slim_{timestamp}.json', indent=False)
+
+        self.cache.save()
         logger.info(f"Saved PyPI data to {output_file}")
         logger.info(f"Collected {len(all_metrics)} packages for {list_name}")
 
         return all_metrics
 
+    def collect_for_list(self, tech_list: Dict, list_name: str) -> List[Dict]:
+        """
+        Collect PyPI data for a single list with a dedicated client
+
+        Args:
+            tech_list: Technology list dictionary
+            list_name: Name of the list (for file naming)
+
+        Returns:
+            List of metrics dictionaries
+        """
+        async def _run():
+            async with self._new_client() as client:
+                return await self.collect_for_list_async(tech_list, list_name, client)
+
+        return asyncio.run(_run())
+
 
 def collect_pypi_data(list_name: str = None) -> Dict[str, List[Dict]]:
     """
@@ -255,19 +363,24 @@ def collect_pypi_data(list_name: str = None) -> Dict[str, List[Dict]]:
     from ..utils.config import ACTIVE_LISTS
 
     collector = PyPICollector()
-    results = {}
 
     lists_to_process = {list_name: ACTIVE_LISTS[list_name]} if list_name else ACTIVE_LISTS
 
-    for name, tech_list in lists_to_process.items():
-        logger.info(f"\n{'='*60}")
-        logger.info(f"Processing {name.upper()} list")
-        logger.info(f"{'='*60}")
-
-        metrics = collector.collect_for_list(tech_list, name)
-        results[name] = metrics
-
-    return results
+    # One client (and thus one warm connection pool) for every list in
+    # the run, so the second list skips DNS and TLS setup entirely
+    async def _collect_all():
+        results = {}
+        async with collector._new_client() as client:
+            for name, tech_list in lists_to_process.items():
+                logger.info(f"\n{'='*60}")
+                logger.info(f"Processing {name.upper()} list")
+                logger.info(f"{'='*60}")
+
+                results[name] = await collector.collect_for_list_async(
+                    tech_list, name, client)
+        return results
+
+    return asyncio.run(_collect_all())
 
 
 if __name__ == "__main__":
@@ -3,20 +3,41 @@ Visualization Module
 Creates charts and graphs for technology adoption reports
 """
 
-import json
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend
 
-from ..utils.config import PROCESSED_DATA_DIR, REPORTS_DIR
+from ..utils.config import CHART_DPI, PROCESSED_DATA_DIR, REPORTS_DIR
+from ..utils.jsonio import load_json
 from ..utils.logger import get_default_logger
 
 logger = get_default_logger(__name__)
 
 
+def _render_one(task: Tuple[str, tuple]) -> Optional[Path]:
+    """
+    Render a single chart in a worker process
+
+    Args:
+        task: (method name on ChartGenerator, positional args)
+
+    Returns:
+        Path of the rendered chart, or None if its data was missing
+    """
+    method_name, args = task
+    generator = ChartGenerator()
+    try:
+        return getattr(generator, method_name)(*args)
+    finally:
+        plt.close(generator._fig)
+
+
 class ChartGenerator:
     """Generates visualizations for adoption reports"""
 
@@ -30,14 +51,24 @@ class ChartGenerator:
         # Set style
         plt.style.use('seaborn-v0_8-darkgrid')
 
+        # Several chart methods read the same processed file (e.g. the
+        # quality validation snapshot); parse each pattern at most once
+        self._file_cache: Dict[str, Optional[Dict]] = {}
+
+        # One Figure reused for every chart: figure creation and Agg
+        # backend setup is among matplotlib's slowest steps, so clear
+        # the axes between charts instead of reallocating
+        self._fig, self._ax = plt.subplots(figsize=(12, 8))
+
     def load_latest_file(self, pattern: str) -> Optional[Dict]:
         """Load the most recent file matching pattern"""
-        files = sorted(self.processed_dir.glob(pattern), reverse=True)
-        if not files:
-            return None
+        if pattern in self._file_cache:
+            return self._file_cache[pattern]
 
-        with open(files[0], 'r') as f:
-            return json.load(f)
+        files = sorted(self.processed_dir.glob(pattern), reverse=True)
+        data = load_json(files[0]) if files else None
+        self._file_cache[pattern] = data
+        return data
 
     def create_quality_chart(self, list_name: str) -> Optional[Path]:
         """Create data quality visualization"""
@@ -59,27 +90,26 @@ class ChartGenerator:
         colors = ['#2ecc71', '#f39c12', '#e74c3c', '#9b59b6']
 
         # Create chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._ax
+        ax.clear()
+        self._fig.set_size_inches(10, 6)
         bars = ax.bar(categories, values, color=colors, alpha=0.8, edgecolor='black')
 
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}',
-                       ha='center', va='bottom', fontweight='bold', fontsize=12)
+        # Add value labels on bars (blank for empty categories)
+        ax.bar_label(bars, labels=[str(int(v)) if v > 0 else '' for v in values],
+                     fontweight='bold', fontsize=12)
 
         ax.set_ylabel('Number of Technologies', fontsize=12, fontweight='bold')
         ax.set_title(f'{list_name.title()} - Data Quality Distribution', fontsize=14, fontweight='bold')
         ax.set_ylim(0, max(values) * 1.2 if max(values) > 0 else 1)
 
-        plt.tight_layout()
+        self._fig.tight_layout()
 
         # Save
         output_path = self.charts_dir / f'{list_name}_quality_chart.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # tight_layout already ran, so skip the extra render pass that
+        # bbox_inches='tight' performs to recompute the bounding box
+        self._fig.savefig(output_path, dpi=CHART_DPI)
 
         logger.info(f"Created quality chart: {output_path.name}")
         return output_path
@@ -106,28 +136,27 @@ class ChartGenerator:
         colors = ['#3498db' if m > 0 else '#e74c3c' for m in momenta]
 
         # Create chart
-        fig, ax = plt.subplots(figsize=(12, 6))
+        ax = self._ax
+        ax.clear()
+        self._fig.set_size_inches(12, 6)
         bars = ax.barh(categories, momenta, color=colors, alpha=0.8, edgecolor='black')
 
-        # Add value labels
-        for i, (bar, momentum) in enumerate(zip(bars, momenta)):
-            width = bar.get_width()
-            label_x = width + (max(momenta) * 0.02) if width >= 0 else width - (max(momenta) * 0.02)
-            ax.text(label_x, bar.get_y() + bar.get_height()/2.,
-                   f'{momentum:.1f}%',
-                   ha='left' if width >= 0 else 'right',
-                   va='center', fontweight='bold', fontsize=10)
+        # Add value labels; bar_label places them past the bar end on
+        # the correct side for negative bars
+        ax.bar_label(bars, labels=[f'{m:.1f}%' for m in momenta],
+                     padding=3, fontweight='bold', fontsize=10)
 
         ax.set_xlabel('Average Monthly Momentum (%)', fontsize=12, fontweight='bold')
         ax.set_title(f'{list_name.title()} - Category Momentum Analysis', fontsize=14, fontweight='bold')
         ax.axvline(x=0, color='black', linestyle='-', linewidth=0.8)
 
-        plt.tight_layout()
+        self._fig.tight_layout()
 
         # Save
         output_path = self.charts_dir / f'{list_name}_category_momentum.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # tight_layout already ran, so skip the extra render pass that
+        # bbox_inches='tight' performs to recompute the bounding box
+        self._fig.savefig(output_path, dpi=CHART_DPI)
 
         logger.info(f"Created category momentum chart: {output_path.name}")
         return output_path
@@ -155,34 +184,32 @@ class ChartGenerator:
         if not tech_stars:
             return None
 
-        # Sort and get top 10
-        tech_stars.sort(key=lambda x: x['stars'], reverse=True)
-        top_10 = tech_stars[:10]
+        # Top 10 without sorting the full list
+        top_10 = heapq.nlargest(10, tech_stars, key=lambda x: x['stars'])
 
         names = [t['name'] for t in top_10]
         stars = [t['stars'] for t in top_10]
 
         # Create chart
-        fig, ax = plt.subplots(figsize=(12, 8))
+        ax = self._ax
+        ax.clear()
+        self._fig.set_size_inches(12, 8)
         bars = ax.barh(names, stars, color='#3498db', alpha=0.8, edgecolor='black')
 
         # Add value labels
-        for bar in bars:
-            width = bar.get_width()
-            label = f'{int(width/1000)}K' if width >= 1000 else str(int(width))
-            ax.text(width + (max(stars) * 0.01), bar.get_y() + bar.get_height()/2.,
-                   label,
-                   ha='left', va='center', fontweight='bold', fontsize=10)
+        labels = [f'{s // 1000}K' if s >= 1000 else str(s) for s in stars]
+        ax.bar_label(bars, labels=labels, padding=3, fontweight='bold', fontsize=10)
 
         ax.set_xlabel('GitHub Stars', fontsize=12, fontweight='bold')
         ax.set_title(f'{list_name.title()} - Top Technologies by GitHub Stars', fontsize=14, fontweight='bold')
 
-        plt.tight_layout()
+        self._fig.tight_layout()
 
         # Save
         output_path = self.charts_dir / f'{list_name}_top_technologies.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # tight_layout already ran, so skip the extra render pass that
+        # bbox_inches='tight' performs to recompute the bounding box
+        self._fig.savefig(output_path, dpi=CHART_DPI)
 
         logger.info(f"Created top technologies chart: {output_path.name}")
         return output_path
@@ -200,34 +227,35 @@ class ChartGenerator:
         lists = comparative.get('lists_compared', ['List 1', 'List 2'])
 
         # Data
+        per_list = velocity.get('per_list', {})
         categories = [lists[0].title(), lists[1].title()]
         avg_momenta = [
-            velocity.get(f'{lists[0]}_average_momentum', 0),
-            velocity.get(f'{lists[1]}_average_momentum', 0)
+            per_list.get(lists[0], {}).get('average_momentum', 0),
+            per_list.get(lists[1], {}).get('average_momentum', 0)
         ]
         colors = ['#3498db', '#e67e22']
 
         # Create chart
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._ax
+        ax.clear()
+        self._fig.set_size_inches(10, 6)
         bars = ax.bar(categories, avg_momenta, color=colors, alpha=0.8, edgecolor='black', width=0.6)
 
         # Add value labels
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{height:.1f}%',
-                   ha='center', va='bottom', fontweight='bold', fontsize=12)
+        ax.bar_label(bars, labels=[f'{m:.1f}%' for m in avg_momenta],
+                     fontweight='bold', fontsize=12)
 
         ax.set_ylabel('Average Monthly Momentum (%)', fontsize=12, fontweight='bold')
         ax.set_title('Comparative Adoption Velocity', fontsize=14, fontweight='bold')
         ax.set_ylim(0, max(avg_momenta) * 1.2 if max(avg_momenta) > 0 else 1)
 
-        plt.tight_layout()
+        self._fig.tight_layout()
 
         # Save
         output_path = self.charts_dir / 'comparative_velocity.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        # tight_layout already ran, so skip the extra render pass that
+        # bbox_inches='tight' performs to recompute the bounding box
+        self._fig.savefig(output_path, dpi=CHART_DPI)
 
         logger.info(f"Created comparative velocity chart: {output_path.name}")
         return output_path
@@ -235,37 +263,31 @@ class ChartGenerator:
     def generate_all_charts(self) -> Dict[str, List[Path]]:
         """Generate all visualization charts"""
         logger.info("Generating visualization charts...")
-        charts = {}
-
-        # Enterprise charts
-        logger.info("\nGenerating enterprise charts...")
-        enterprise_charts = []
-        if chart := self.create_quality_chart('enterprise'):
-            enterprise_charts.append(chart)
-        if chart := self.create_category_momentum_chart('enterprise'):
-            enterprise_charts.append(chart)
-        if chart := self.create_top_technologies_chart('enterprise'):
-            enterprise_charts.append(chart)
-        charts['enterprise'] = enterprise_charts
-
-        # Fintech charts
-        logger.info("\nGenerating fintech charts...")
-        fintech_charts = []
-        if chart := self.create_quality_chart('fintech'):
-            fintech_charts.append(chart)
-        if chart := self.create_category_momentum_chart('fintech'):
-            fintech_charts.append(chart)
-        if chart := self.create_top_technologies_chart('fintech'):
-            fintech_charts.append(chart)
-        charts['fintech'] = fintech_charts
-
-        # Comparative charts
-        logger.info("\nGenerating comparative charts...")
-        comparative_charts = []
-        if chart := self.create_comparative_velocity_chart():
-            comparative_charts.append(chart)
-        charts['comparative'] = comparative_charts
 
+        # Each chart is an independent render, so fan the work out to
+        # one process per chart (Agg is not thread-safe with a shared
+        # figure, but separate processes each build their own generator)
+        tasks = [
+            ('enterprise', 'create_quality_chart', ('enterprise',)),
+            ('enterprise', 'create_category_momentum_chart', ('enterprise',)),
+            ('enterprise', 'create_top_technologies_chart', ('enterprise',)),
+            ('fintech', 'create_quality_chart', ('fintech',)),
+            ('fintech', 'create_category_momentum_chart', ('fintech',)),
+            ('fintech', 'create_top_technologies_chart', ('fintech',)),
+            ('comparative', 'create_comparative_velocity_chart', ()),
+        ]
+
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                _render_one, [(method, args) for _, method, args in tasks]))
+
+        charts: Dict[str, List[Path]] = {'enterprise': [], 'fintech': [], 'comparative': []}
+        for (group, _, _), chart in zip(tasks, results):
+            if chart:
+                charts[group].append(chart)
+
+        plt.close(self._fig)
         logger.info(f"\n✓ Generated {sum(len(v) for v in charts.values())} charts total")
         return charts
 
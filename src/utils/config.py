@@ -22,9 +22,14 @@ PROCESSED_DATA_DIR = DATA_DIR / 'processed'
 REPORTS_DIR = PROJECT_ROOT / 'reports'
 LOGS_DIR = PROJECT_ROOT / 'logs'
 
-# Ensure directories exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, REPORTS_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Ensure directories exist. Only the leaf directories are created
+# (DATA_DIR is implied as a parent), and the common case — everything
+# already there — is a single stat per leaf instead of a mkdir walk
+# up the tree on every import of this module
+for directory in (RAW_DATA_DIR, PROCESSED_DATA_DIR, REPORTS_DIR, LOGS_DIR):
+    if not directory.is_dir():
+        os.makedirs(directory, exist_ok=True)
+del directory
 
 # Strategic List 1: ENTERPRISE AI ADOPTION
 # Focus: AI platforms, infrastructure, and ML tools that enterprises adopt
@@ -257,6 +262,16 @@ ACTIVE_LISTS = {
     "fintech": FINTECH_AI
 }
 
+# Pre-group each list's technologies by data source so collectors and
+# analyzers iterate only the relevant subset instead of re-checking
+# key membership per technology
+for _tech_list in ACTIVE_LISTS.values():
+    _tech_list['by_source'] = {
+        source: [tech for tech in _tech_list['technologies'] if source in tech]
+        for source in ('github', 'npm', 'pypi')
+    }
+del _tech_list
+
 # API Rate Limits
 GITHUB_RATE_LIMIT = 5000  # per hour for authenticated requests
 GITHUB_DELAY = 0.5  # seconds between requests to be respectful
@@ -269,3 +284,4 @@ VELOCITY_SPIKE_THRESHOLD = 5.0  # 500% growth in one period = anomaly
 # Report Configuration
 REPORT_FORMATS = ['markdown', 'pdf']
 TOP_N_INSIGHTS = 5  # Number of top insights to highlight
+CHART_DPI = 120  # Screen-oriented; reports are read on screen, not printed
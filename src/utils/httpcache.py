@@ -0,0 +1,122 @@
+"""
+URL-keyed TTL cache for collector HTTP responses
+Registry metadata changes at publish frequency (minutes to days) while
+reports are re-run far more often during development, so repeated GETs
+within the TTL window are answered from cache instead of the network.
+Stored ETags let callers revalidate expired entries with a conditional
+GET: a 304 answer refreshes the entry without re-downloading the body
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .jsonio import dump_json, load_json
+from .logger import get_default_logger
+
+logger = get_default_logger(__name__)
+
+DEFAULT_TTL = 300.0  # seconds; npm sends Cache-Control: max-age=300
+
+
+class ResponseCache:
+    """Two-tier (in-memory + JSON file) TTL cache for GET responses"""
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_TTL):
+        """
+        Initialize response cache
+
+        Args:
+            path: JSON file backing the disk tier
+            ttl: Seconds a cached response stays fresh
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # url -> [expires_at, etag or None, data]; expired entries are
+        # kept for ETag revalidation until the next save() prunes them
+        self._entries: Dict[str, List] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        """Load the disk tier"""
+        try:
+            raw = load_json(self.path)
+        except (OSError, ValueError):
+            return
+        for url, entry in raw.items():
+            if len(entry) == 2:  # pre-ETag cache files
+                entry = [entry[0], None, entry[1]]
+            self._entries[url] = entry
+
+    def get(self, url: str) -> Optional[dict]:
+        """
+        Return the cached response for a URL, or None if missing/stale
+
+        Args:
+            url: Full request URL (the cache key)
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry[0] <= time.time():
+                return None
+            return entry[2]
+
+    def get_etag(self, url: str) -> Optional[str]:
+        """
+        Return the stored ETag for a URL, even if the entry expired
+
+        Args:
+            url: Full request URL (the cache key)
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            return entry[1] if entry is not None else None
+
+    def refresh(self, url: str) -> Optional[dict]:
+        """
+        Re-arm an entry's TTL after a 304 and return its stored body
+
+        Args:
+            url: Full request URL (the cache key)
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            entry[0] = time.time() + self.ttl
+            self._dirty = True
+            return entry[2]
+
+    def set(self, url: str, data: dict, etag: Optional[str] = None):
+        """
+        Cache a response for the configured TTL
+
+        Args:
+            url: Full request URL (the cache key)
+            data: Parsed JSON response body
+            etag: ETag header of the response, for later revalidation
+        """
+        with self._lock:
+            self._entries[url] = [time.time() + self.ttl, etag, data]
+            self._dirty = True
+
+    def save(self):
+        """Persist the in-memory tier to disk if anything changed
+
+        Expired entries with an ETag are kept so future runs can
+        revalidate them; expired entries without one are pruned.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            keep = {url: entry for url, entry in self._entries.items()
+                    if entry[0] > now or entry[1] is not None}
+            try:
+                dump_json(keep, self.path, indent=False)
+                self._dirty = False
+            except OSError as e:
+                logger.warning(f"Could not persist HTTP cache to {self.path}: {e}")
@@ -0,0 +1,154 @@
+"""
+JSON read/write helpers for Tech Adoption Reality Checker
+Uses orjson when available for faster encode/decode, with stdlib fallback
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Large write buffer to cut syscall count on big report files
+_WRITE_BUFFER_SIZE = 131072
+
+# zstd frame header; compressed files keep their .json name and are
+# recognized by content, so filename-based scans and timestamp stems
+# keep working unchanged
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _contains_nonfinite(data: Any) -> bool:
+    """
+    Check whether any float in a payload is inf/-inf/nan
+
+    orjson serializes non-finite floats as null, but the velocity
+    payloads use float('inf') as a designed sentinel (new-emergence
+    baselines) that must round-trip. Payloads carrying one take the
+    stdlib path, which writes the Infinity/NaN literals _loads can
+    parse back. The scan short-circuits on the first hit and is cheap
+    next to the encode itself.
+    """
+    if type(data) is float:
+        return not math.isfinite(data)
+    if type(data) is dict:
+        return any(_contains_nonfinite(v) for v in data.values())
+    if type(data) is list or type(data) is tuple:
+        return any(_contains_nonfinite(v) for v in data)
+    return False
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes, tolerating stdlib-only literals"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written via the stdlib path may carry Infinity/NaN
+            # literals, which orjson rejects
+            pass
+    return json.loads(raw)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Load a JSON file
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    if raw[:4] == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError(f"{path} is zstd-compressed but zstandard is not installed")
+        raw = zstandard.ZstdDecompressor().decompress(raw)
+
+    return _loads(raw)
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to compact JSON bytes
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None and not _contains_nonfinite(data):
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def append_ndjson(record: Any, path: Union[str, Path]) -> None:
+    """
+    Append one record to a newline-delimited JSON file
+
+    Args:
+        record: JSON-serializable record
+        path: Destination NDJSON file path
+    """
+    with open(path, 'ab') as f:
+        f.write(dumps_json(record))
+        f.write(b'\n')
+
+
+def load_ndjson(path: Union[str, Path]) -> list:
+    """
+    Load all records from a newline-delimited JSON file
+
+    Args:
+        path: Path to the NDJSON file
+
+    Returns:
+        List of parsed records
+    """
+    with open(path, 'rb') as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def dump_json(data: Any, path: Union[str, Path], indent: bool = True,
+              compress: bool = False) -> None:
+    """
+    Write data to a JSON file
+
+    Args:
+        data: JSON-serializable data
+        path: Destination file path
+        indent: Whether to pretty-print with 2-space indentation
+        compress: Whether to zstd-compress on disk (load_json detects
+                  compressed files by content, falls back to plain JSON
+                  when zstandard is unavailable)
+    """
+    if orjson is not None and not _contains_nonfinite(data):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        encoded = orjson.dumps(data, option=option)
+    else:
+        encoded = json.dumps(data, indent=2 if indent else None).encode()
+
+    if compress and zstandard is not None:
+        encoded = zstandard.ZstdCompressor(level=3).compress(encoded)
+
+    # Write to a temp file and atomically replace, so readers never see
+    # a partially written report
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(encoded)
+    os.replace(tmp_path, path)
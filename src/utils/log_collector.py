@@ -0,0 +1,133 @@
+"""
+Datagram log collector for Tech Adoption Reality Checker
+
+Receives records sent by setup_logger(transport='udp'/'unix') and owns
+all disk I/O, so worker processes never touch the log file (no inode
+contention when several collectors run in parallel). Writes go through
+a 64 KB buffer flushed every 200 ms, turning thousands of per-record
+writes into a handful of block writes.
+
+Run alongside the pipeline:
+
+    python -m src.utils.log_collector            # UDP on 127.0.0.1:9021
+    python -m src.utils.log_collector --unix     # unix datagram socket
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import select
+import socket
+import struct
+import sys
+import time
+from pathlib import Path
+
+from .logger import (UDP_LOG_ADDRESS, UNIX_LOG_SOCKET, _DEFAULT_LOG_FILE,
+                     _CachedTimeFormatter)
+
+# Flush cadence: buffered bytes hit disk at least this often, so a tail
+# of the output file lags live logging by at most one interval
+FLUSH_INTERVAL = 0.2
+BUFFER_SIZE = 64 * 1024
+# Largest datagram we accept; DatagramHandler records are far smaller
+_MAX_DATAGRAM = 65536
+
+
+def _open_socket(unix_path: str = None) -> socket.socket:
+    """Bind the receive socket (UDP by default, unix datagram on request)"""
+    if unix_path:
+        try:
+            os.unlink(unix_path)
+        except FileNotFoundError:
+            pass
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(unix_path)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind(UDP_LOG_ADDRESS)
+    return sock
+
+
+def _decode_record(data: bytes):
+    """
+    Rebuild a LogRecord from a DatagramHandler payload
+
+    The payload is a 4-byte big-endian length prefix followed by a
+    pickled record dict. Only accept these from trusted local senders —
+    unpickling is code execution by design.
+    """
+    (slen,) = struct.unpack('>L', data[:4])
+    return logging.makeLogRecord(pickle.loads(data[4:4 + slen]))
+
+
+def serve(sock: socket.socket, output_file: str):
+    """Receive records until interrupted, batching writes to output_file"""
+    formatter = _CachedTimeFormatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    out = open(output_file, 'ab', buffering=BUFFER_SIZE)
+    last_flush = time.monotonic()
+    dirty = False
+    try:
+        while True:
+            ready, _, _ = select.select([sock], [], [], FLUSH_INTERVAL)
+            if ready:
+                data = sock.recv(_MAX_DATAGRAM)
+                try:
+                    record = _decode_record(data)
+                    line = (formatter.format(record) + '\n').encode(
+                        'utf-8', 'replace')
+                except Exception as e:
+                    # A short packet or a record truncated by recv (a
+                    # large pickled traceback can exceed the datagram
+                    # cap) must not take the collector down — senders
+                    # are fire-and-forget and would silently lose every
+                    # later record
+                    sys.stderr.write(
+                        f"dropped undecodable datagram "
+                        f"({len(data)} bytes): {e}\n")
+                else:
+                    out.write(line)
+                    dirty = True
+            now = time.monotonic()
+            if dirty and now - last_flush >= FLUSH_INTERVAL:
+                out.flush()
+                last_flush = now
+                dirty = False
+    except KeyboardInterrupt:
+        pass
+    finally:
+        out.flush()
+        out.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Collect datagram log records into a single file')
+    parser.add_argument('--unix', action='store_true',
+                        help=f'listen on the unix socket {UNIX_LOG_SOCKET} '
+                             f'instead of UDP {UDP_LOG_ADDRESS[0]}:'
+                             f'{UDP_LOG_ADDRESS[1]}')
+    parser.add_argument('--out', default=_DEFAULT_LOG_FILE,
+                        help='file the collected records are appended to')
+    args = parser.parse_args(argv)
+
+    unix_path = UNIX_LOG_SOCKET if args.unix else None
+    sock = _open_socket(unix_path)
+    try:
+        serve(sock, args.out)
+    finally:
+        sock.close()
+        if unix_path:
+            try:
+                os.unlink(unix_path)
+            except FileNotFoundError:
+                pass
+
+
+if __name__ == '__main__':
+    main()
@@ -2,61 +2,470 @@
 Logging utilities for Tech Adoption Reality Checker
 """
 
+import atexit
+import functools
+import io
 import logging
+import logging.handlers
+import os
+import queue
+import signal
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 
-def setup_logger(name: str, log_file: str = None, level=logging.INFO):
+from .jsonio import dumps_json
+
+# Skip the per-record current_thread()/getpid()/multiprocessing lookups
+# in makeRecord; nothing in this project logs those fields
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# No format string uses pathname/filename/lineno, so skip the
+# sys._getframe stack walk findCaller() does per record
+logging._srcfile = None
+
+# Level filtering is anchored at the root once, so module loggers can
+# stay at NOTSET and inherit it. setLevel clears Logger._cache on every
+# call; leaving children untouched keeps isEnabledFor a cached dict hit
+# instead of a parent walk after each setup_logger call
+_ROOT_LEVEL = logging.INFO
+logging.getLogger().setLevel(_ROOT_LEVEL)
+
+
+def trace(logger, fmt, *args):
+    """
+    Debug-log with an explicit enabled check
+
+    A disabled call costs one level comparison — no record, no argument
+    formatting. Pass %-style args (`trace(log, "n=%d", n)`), never a
+    pre-built f-string, so the message is only interpolated when DEBUG
+    is actually on.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger._log(logging.DEBUG, fmt, args)
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches writes in the underlying buffer
+
+    The stock handler flushes after every record — one or two syscalls
+    per log line. Records here coalesce in the 64 KB console buffer and
+    only ERROR and above force the buffer out immediately (exit and
+    SIGTERM flush the rest).
+    """
+
+    def flush(self):
+        # Batched on purpose; emit() flushes for ERROR+ records
+        pass
+
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+
+
+def _make_console_stream():
+    """Wrap stdout in a 64 KB block buffer, with flush-on-exit hooks"""
+    try:
+        raw = sys.stdout.buffer
+    except AttributeError:
+        # stdout already replaced (tests, captured output): use as-is
+        return sys.stdout
+
+    stream = io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=65536),
+        encoding=getattr(sys.stdout, 'encoding', None) or 'utf-8',
+        line_buffering=False, write_through=False)
+
+    def _flush(*_args):
+        try:
+            stream.flush()
+        except ValueError:
+            pass  # interpreter teardown already closed the buffer
+
+    atexit.register(_flush)
+    try:
+        previous = signal.getsignal(signal.SIGTERM)
+
+        def _on_sigterm(signum, frame):
+            _flush()
+            if callable(previous):
+                previous(signum, frame)
+            else:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.raise_signal(signal.SIGTERM)
+
+        signal.signal(signal.SIGTERM, _on_sigterm)
+    except ValueError:
+        pass  # not the main thread; exit flush still applies
+    return stream
+
+
+class _TimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """
+    Midnight-rotating file handler without the per-emit path stat
+
+    The stock shouldRollover re-checks os.path.exists/isfile on every
+    record; our log files live on local disk and nothing removes them
+    mid-run, so the clock comparison alone decides rollover.
+    """
+
+    def shouldRollover(self, record):
+        return int(record.created) >= self.rolloverAt
+
+
+class RawFileHandler(logging.Handler):
+    """
+    Append-only file handler that writes through a raw fd
+
+    Skips the TextIOWrapper/BufferedWriter stack entirely: each record is
+    one os.write to an O_APPEND descriptor. O_APPEND appends are atomic
+    for writes under PIPE_BUF, so the handler also drops the per-emit
+    lock. No batching and no rotation — use it for short-lived scripts
+    or audit trails where every record must hit disk immediately;
+    long-running pipelines should keep the default batching handler.
+    """
+
+    def __init__(self, filename, level=logging.NOTSET):
+        super().__init__(level)
+        self.baseFilename = os.fspath(filename)
+        self._fd = os.open(self.baseFilename,
+                           os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def createLock(self):
+        self.lock = None
+
+    def acquire(self):
+        pass
+
+    def release(self):
+        pass
+
+    def emit(self, record):
+        try:
+            os.write(self._fd,
+                     (self.format(record) + '\n').encode('utf-8', 'replace'))
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        super().close()
+
+
+class FastJsonFormatter(logging.Formatter):
+    """
+    One JSON object per line, serialized by orjson when available
+
+    For logs that get parsed downstream (grep/ELK) this moves record
+    serialization from %-substitution to the C encoder, and the output
+    needs no quoting rules beyond JSON's own.
+    """
+
+    def format(self, record):
+        entry = {
+            't': record.created,
+            'lvl': record.levelname,
+            'name': record.name,
+            'msg': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return dumps_json(entry).decode()
+
+
+class _BatchingFileHandler(_TimedRotatingFileHandler):
+    """
+    Rotating file handler that writes records in batches
+
+    MemoryHandler still re-dispatches records one at a time on flush;
+    here each record is formatted into a list as it arrives and a drain
+    writes the whole joined batch in one call — one write per `capacity`
+    records. ERROR and above, rollover, flush() and close() all drain
+    immediately.
+    """
+
+    def __init__(self, filename, capacity=512, flush_level=logging.ERROR,
+                 **kwargs):
+        super().__init__(filename, **kwargs)
+        self._batch = []
+        self._capacity = capacity
+        self._flush_level = flush_level
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.flush()
+                self.doRollover()
+            self._batch.append(self.format(record) + self.terminator)
+            if (len(self._batch) >= self._capacity
+                    or record.levelno >= self._flush_level):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._batch:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write(''.join(self._batch))
+                self._batch.clear()
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that caches the rendered timestamp per whole second
+
+    The file format has second resolution, and records arrive in bursts,
+    so most emits reuse the previous localtime()+strftime() result
+    instead of re-running both per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ''
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime(datefmt or '%Y-%m-%d %H:%M:%S',
+                                           time.localtime(sec))
+        return self._last_str
+
+# All loggers enqueue records here; a single background QueueListener
+# owns the real console/file handlers, so a log call in application code
+# is a cheap enqueue with no formatting or I/O in the caller thread
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+_console_registered = False
+_listener_files = set()
+# Log directories already created this process; repeat setup calls (and
+# several log files sharing one directory) skip the mkdir stat entirely
+_ensured_dirs = set()
+# Datagram transports already attached to the listener ('udp'/'unix')
+_transports = set()
+
+# Where transport='udp' sends records and where the collector listens;
+# datagrams are fire-and-forget, so a dead collector never blocks a run
+UDP_LOG_ADDRESS = ('127.0.0.1', 9021)
+# Names that have completed setup; repeat setup_logger calls return the
+# existing logger without touching .handlers or re-running setLevel
+# (which would invalidate the logging module's level cache)
+_configured = set()
+
+
+def _stop_listener():
+    """Drain pending records and stop the background listener"""
+    if _listener is not None:
+        _listener.stop()
+
+
+def _register_handlers(handlers):
+    """Attach handlers to the shared listener, starting it on first use"""
+    global _listener
+    if not handlers:
+        return
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(
+            _log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+    else:
+        _listener.handlers = _listener.handlers + tuple(handlers)
+
+
+def _flush_before_fork():
+    """Flush listener handlers so a child inherits empty buffers"""
+    if _listener is None:
+        return
+    for handler in _listener.handlers:
+        try:
+            handler.flush()
+            # _BufferedStreamHandler.flush is a deliberate no-op;
+            # flush its underlying console buffer directly
+            stream = getattr(handler, 'stream', None)
+            if stream is not None:
+                stream.flush()
+        except (ValueError, OSError):
+            pass
+
+
+def _restart_listener_in_child():
+    """
+    Restart the listener after fork()
+
+    A forked child (ProcessPoolExecutor chart workers, for one) inherits
+    the queue and the QueueHandlers but not the listener thread, so
+    anything it logged would sit in its queue copy forever — including
+    errors. Drop inherited queue records and half-built batches (the
+    parent still owns those) and start a fresh listener over the same
+    handlers; the file handlers append, so parent and child interleave
+    whole batches safely.
+    """
+    global _listener
+    if _listener is None:
+        return
+    try:
+        while True:
+            _log_queue.get_nowait()
+    except queue.Empty:
+        pass
+    for handler in _listener.handlers:
+        if isinstance(handler, _BatchingFileHandler):
+            handler._batch.clear()
+    _listener = logging.handlers.QueueListener(
+        _log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_flush_before_fork,
+                        after_in_child=_restart_listener_in_child)
+
+
+def setup_logger(name: str, log_file: str = None, level=logging.INFO,
+                 capacity: int = 512, flush_level=logging.ERROR,
+                 json_format: bool = False, transport: str = 'file'):
     """
     Set up logger with console and file handlers
 
+    File records are batched in the handler so a write happens once per
+    `capacity` records rather than per log call; records at
+    `flush_level` or above (and interpreter exit) flush immediately.
+
     Args:
         name: Logger name
-        log_file: Optional log file path
+        log_file: Optional log file path (ignored for datagram transports)
         level: Logging level
+        capacity: Records buffered between file flushes
+        flush_level: Level that forces an immediate flush
+        json_format: Write file records as JSON lines (FastJsonFormatter)
+                     instead of the human-readable format
+        transport: 'file' writes in-process; 'udp' or 'unix' sends
+                   records as datagrams to the log_collector process,
+                   which owns all disk I/O
 
     Returns:
         Logger instance
     """
+    global _console_registered
+
+    if transport not in ('file', 'udp', 'unix'):
+        raise ValueError(f"unknown log transport: {transport!r}")
+
+    if name in _configured:
+        return logging.getLogger(name)
+
     logger = logging.getLogger(name)
-    logger.setLevel(level)
+    # Dotted module names inherit the root level set at import; an
+    # explicit setLevel is only needed when the caller wants something
+    # different (it blows the level cache for the whole subtree)
+    if '.' not in name or level != _ROOT_LEVEL:
+        logger.setLevel(level)
 
     # Avoid adding handlers multiple times
     if logger.handlers:
+        _configured.add(name)
         return logger
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # The listener broadcasts every record to every registered handler,
+    # so the console handler and each log file are registered exactly
+    # once per process no matter how many loggers are set up
+    with _listener_lock:
+        new_handlers = []
 
-    simple_formatter = logging.Formatter(
-        '%(levelname)s - %(message)s'
-    )
+        if not _console_registered:
+            simple_formatter = logging.Formatter(
+                '%(levelname)s - %(message)s'
+            )
+            console_handler = _BufferedStreamHandler(_make_console_stream())
+            console_handler.setLevel(level)
+            console_handler.setFormatter(simple_formatter)
+            new_handlers.append(console_handler)
+            _console_registered = True
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
+        if transport != 'file':
+            # Worker processes do no file I/O at all: records leave as
+            # fire-and-forget datagrams and the collector process does
+            # the buffered writes (see src.utils.log_collector)
+            if transport not in _transports:
+                if transport == 'udp':
+                    net_handler = logging.handlers.DatagramHandler(
+                        *UDP_LOG_ADDRESS)
+                else:
+                    net_handler = logging.handlers.DatagramHandler(
+                        UNIX_LOG_SOCKET, None)
+                net_handler.setLevel(level)
+                new_handlers.append(net_handler)
+                _transports.add(transport)
+        elif log_file and log_file not in _listener_files:
+            log_path = Path(log_file)
+            parent = str(log_path.parent)
+            if parent not in _ensured_dirs:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(parent)
 
-    # File handler (if log file specified)
-    if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+            if json_format:
+                detailed_formatter = FastJsonFormatter()
+            else:
+                detailed_formatter = _CachedTimeFormatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                    datefmt='%Y-%m-%d %H:%M:%S'
+                )
+            # delay=True defers the open() until the first record, so a
+            # process that never logs to file never pays the FD; rotation
+            # happens in-process at midnight instead of via dated names
+            file_handler = _BatchingFileHandler(
+                log_file, capacity=capacity, flush_level=flush_level,
+                when='midnight', backupCount=14, delay=True)
+            file_handler.setLevel(level)
+            file_handler.setFormatter(detailed_formatter)
+            new_handlers.append(file_handler)
+            _listener_files.add(log_file)
+            # Drain anything still buffered at interpreter shutdown
+            atexit.register(file_handler.close)
 
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        _register_handlers(new_handlers)
+
+    # The caller-facing logger only enqueues; the listener thread does
+    # the formatting and I/O
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _configured.add(name)
 
     return logger
 
+# Resolved once at import: the log directory (and its stat/mkdir) and
+# the log file name, instead of per get_default_logger call. Daily files
+# come from the handler's midnight rotation, not from a dated name
+_LOG_DIR = Path(__file__).resolve().parents[2] / 'logs'
+try:
+    _LOG_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    pass  # read-only checkout; setup_logger surfaces the real error
+_DEFAULT_LOG_FILE = str(_LOG_DIR / 'system.log')
+# Datagram socket for transport='unix'; the collector binds it
+UNIX_LOG_SOCKET = str(_LOG_DIR / 'log.sock')
+
+
+@functools.lru_cache(maxsize=None)
 def get_default_logger(module_name: str):
     """
-    Get default logger for a module with standard log file
+    Get default logger for a module with standard log file (memoized)
 
     Args:
         module_name: Name of the module requesting logger
@@ -64,11 +473,4 @@ def get_default_logger(module_name: str):
     Returns:
         Logger instance
     """
-    log_dir = Path(__file__).parent.parent.parent / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Daily log file
-    today = datetime.now().strftime('%Y-%m-%d')
-    log_file = log_dir / f'{today}_system.log'
-
-    return setup_logger(module_name, str(log_file))
+    return setup_logger(module_name, _DEFAULT_LOG_FILE)